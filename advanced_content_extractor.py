@@ -20,6 +20,53 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Extraction patterns, compiled once at import instead of per call
+_TITLE_SUFFIX_RE = re.compile(r'\s*[\|-].*$')
+# Emails and phones in one pass over the page text; email is tried first so digits
+# inside an address's local part aren't also reported as a phone number
+_CONTACT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<phone>(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+)
+_ADDRESS_CLASS_RE = re.compile('address', re.I)
+# Social link needles in priority order, checked once per href
+_SOCIAL_LINKS = (
+    ('facebook.com', 'facebook'),
+    ('twitter.com', 'twitter'),
+    ('x.com', 'twitter'),
+    ('linkedin.com', 'linkedin'),
+    ('instagram.com', 'instagram'),
+)
+_OFFICER_HEADING_RE = re.compile('Officer|Director|Authorized Person', re.I)
+# "Title: PRESIDENT" followed by a name, or "President: First Last"
+_OWNER_PATTERNS = (
+    re.compile(r'Title[:\s]+(?:PRESIDENT|PRES|CEO|OWNER|MGR|MANAGER).*?\n([A-Z][A-Z\s,]+)', re.MULTILINE),
+    re.compile(r'(?:President|CEO|Owner|Manager)[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)', re.MULTILINE),
+)
+
+
+def _keyword_re(keywords) -> "re.Pattern":
+    """One alternation over literal keywords: a single scan replaces a chain of `in` tests."""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+# Keyword groups matched against lower-cased page strings. Kept as separate
+# patterns: overlapping words ('sales' vs 'sale') must count for each group.
+_SERVICE_KEYWORDS_RE = _keyword_re(['repair', 'maintenance', 'inspection', 'sales', 'financing',
+                                    'warranty', 'parts', 'service', 'detail', 'custom'])
+_ACHIEVEMENT_KEYWORDS_RE = _keyword_re(['award', 'winner', 'best', 'top', 'rated', 'certified',
+                                        'recognized', 'achievement', 'honor', 'excellence'])
+_OFFER_KEYWORDS_RE = _keyword_re(['special', 'offer', 'discount', 'save', 'promotion',
+                                  'deal', 'sale', '%', '$', 'off', 'free'])
+_PAIN_KEYWORDS_RE = _keyword_re(['challenge', 'difficult', 'problem', 'issue', 'struggle',
+                                 'concern', 'need', 'looking for', 'seeking'])
+# Section class words, matched case-insensitively so the class string needn't be lowered
+_NEWS_CLASS_RE = re.compile('news|update|recent|latest|announcement', re.I)
+_TESTIMONIAL_CLASS_RE = re.compile('testimonial|review|feedback', re.I)
+_DATE_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'
+)
+
 
 @dataclass
 class ExtractedContent:
@@ -56,6 +103,10 @@ class AdvancedContentExtractor:
     4. LLM integration for complex understanding
     """
     
+    # Longest slice of extracted page text the regex passes scan, so one huge
+    # or hostile page can't stall the pipeline in backtracking
+    MAX_TEXT_LEN = 200_000
+    
     def __init__(self, use_llm: bool = False):
         """Initialize the extractor."""
         self.use_llm = use_llm
@@ -112,12 +163,14 @@ class AdvancedContentExtractor:
             if owner:
                 result.owner_name = owner
             
-            # Extract content for email personalization
-            result.recent_updates = self._extract_recent_updates(soup)
-            result.services_offered = self._extract_services(soup)
-            result.achievements = self._extract_achievements(soup)
+            # Extract content for email personalization; the page's strings
+            # are walked and lower-cased once and shared by every extractor
+            strings = [(text, text.lower()) for text in soup.stripped_strings]
+            result.recent_updates = self._extract_recent_updates(soup, strings)
+            result.services_offered = self._extract_services(soup, strings)
+            result.achievements = self._extract_achievements(strings)
             result.testimonials = self._extract_testimonials(soup)
-            result.special_offers = self._extract_offers(soup)
+            result.special_offers = self._extract_offers(strings)
             
         except Exception as e:
             logger.warning(f"BeautifulSoup extraction failed: {e}")
@@ -149,7 +202,7 @@ class AdvancedContentExtractor:
         if title:
             title_text = title.get_text().strip()
             # Clean common suffixes
-            title_text = re.sub(r'\s*[\|-].*$', '', title_text)
+            title_text = _TITLE_SUFFIX_RE.sub('', title_text)
             if title_text:
                 return title_text
         
@@ -169,63 +222,59 @@ class AdvancedContentExtractor:
         """Extract contact information."""
         contact = {}
         
-        # Phone patterns
-        phone_pattern = r'(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, html)
-        if phones:
-            contact['phone'] = phones[0]
-        
-        # Email patterns
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, html)
-        if emails:
-            contact['email'] = emails[0]
+        # Social media, collecting mailto:/tel: targets on the same pass
+        # (link text is often just "Email us")
+        link_targets = []
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if href.startswith(('mailto:', 'tel:')):
+                link_targets.append(href)
+                continue
+            for needle, platform in _SOCIAL_LINKS:
+                if needle in href:
+                    contact[platform] = href
+                    break
+        
+        # First phone and first email, from a single scan that stops once both are seen.
+        # Scanning visible text (no scripts/styles) keeps footer contacts inside the cap.
+        text = soup.get_text(' ')[:self.MAX_TEXT_LEN]
+        first = {}
+        for match in _CONTACT_RE.finditer(' '.join([text, *link_targets])):
+            first.setdefault(match.lastgroup, match.group())
+            if len(first) == 2:
+                break
+        if 'phone' in first:
+            contact['phone'] = first['phone']
+        if 'email' in first:
+            contact['email'] = first['email']
         
         # Address extraction (looking for common patterns)
-        address_divs = soup.find_all('div', class_=re.compile('address', re.I))
+        address_divs = soup.find_all('div', class_=_ADDRESS_CLASS_RE)
         if address_divs:
             contact['address'] = address_divs[0].get_text().strip()
         
-        # Social media
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if 'facebook.com' in href:
-                contact['facebook'] = href
-            elif 'twitter.com' in href or 'x.com' in href:
-                contact['twitter'] = href
-            elif 'linkedin.com' in href:
-                contact['linkedin'] = href
-            elif 'instagram.com' in href:
-                contact['instagram'] = href
-        
         return contact
     
     def _extract_owner_info(self, soup: BeautifulSoup, html: str) -> Optional[str]:
         """Extract owner/officer information (optimized for Sunbiz)."""
         
         # Look for officer/director sections
-        officer_sections = soup.find_all(text=re.compile('Officer|Director|Authorized Person', re.I))
+        officer_sections = soup.find_all(text=_OFFICER_HEADING_RE)
         
         for section in officer_sections:
             parent = section.parent
             if parent:
                 # Look for names after titles
-                text = parent.get_text()
-                
-                # Pattern for "Title: PRESIDENT" followed by name
-                patterns = [
-                    r'Title[:\s]+(?:PRESIDENT|PRES|CEO|OWNER|MGR|MANAGER).*?\n([A-Z][A-Z\s,]+)',
-                    r'(?:President|CEO|Owner|Manager)[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-                ]
+                text = parent.get_text()[:self.MAX_TEXT_LEN]
                 
-                for pattern in patterns:
-                    match = re.search(pattern, text, re.MULTILINE)
+                for pattern in _OWNER_PATTERNS:
+                    match = pattern.search(text)
                     if match:
                         return match.group(1).strip()
         
         return None
     
-    def _extract_recent_updates(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_recent_updates(self, soup: BeautifulSoup, strings: List[Tuple[str, str]]) -> List[str]:
         """Extract recent updates/news for personalization."""
         updates = []
         
@@ -233,8 +282,7 @@ class AdvancedContentExtractor:
         for section in soup.find_all(['section', 'div', 'article']):
             # Check for news-related classes or IDs
             if section.get('class'):
-                classes = ' '.join(section.get('class'))
-                if any(word in classes.lower() for word in ['news', 'update', 'recent', 'latest', 'announcement']):
+                if _NEWS_CLASS_RE.search(' '.join(section.get('class'))):
                     # Extract headlines
                     for heading in section.find_all(['h2', 'h3', 'h4']):
                         text = heading.get_text().strip()
@@ -242,14 +290,13 @@ class AdvancedContentExtractor:
                             updates.append(text)
         
         # Look for dated content
-        date_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'
-        for text in soup.stripped_strings:
-            if re.search(date_pattern, text) and len(text) < 200:
+        for text, _ in strings:
+            if _DATE_RE.search(text) and len(text) < 200:
                 updates.append(text)
         
         return updates[:5]  # Limit to 5 most recent
     
-    def _extract_services(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_services(self, soup: BeautifulSoup, strings: List[Tuple[str, str]]) -> List[str]:
         """Extract services offered."""
         services = []
         
@@ -264,28 +311,22 @@ class AdvancedContentExtractor:
                         if text and len(text) < 100:
                             services.append(text)
         
-        # Look for common service keywords
-        service_keywords = ['repair', 'maintenance', 'inspection', 'sales', 'financing', 
-                          'warranty', 'parts', 'service', 'detail', 'custom']
-        
-        for text in soup.stripped_strings:
-            text_lower = text.lower()
-            if any(keyword in text_lower for keyword in service_keywords):
-                if len(text) < 100 and text not in services:
+        # Look for common service keywords (set mirror for O(1) membership)
+        seen = set(services)
+        for text, text_lower in strings:
+            if _SERVICE_KEYWORDS_RE.search(text_lower):
+                if len(text) < 100 and text not in seen:
+                    seen.add(text)
                     services.append(text)
         
-        return list(set(services))[:10]  # Unique, limit to 10
+        return list(dict.fromkeys(services))[:10]  # Unique in page order, limit to 10
     
-    def _extract_achievements(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_achievements(self, strings: List[Tuple[str, str]]) -> List[str]:
         """Extract achievements/awards."""
         achievements = []
         
-        achievement_keywords = ['award', 'winner', 'best', 'top', 'rated', 'certified', 
-                               'recognized', 'achievement', 'honor', 'excellence']
-        
-        for text in soup.stripped_strings:
-            text_lower = text.lower()
-            if any(keyword in text_lower for keyword in achievement_keywords):
+        for text, text_lower in strings:
+            if _ACHIEVEMENT_KEYWORDS_RE.search(text_lower):
                 if len(text) < 150:
                     achievements.append(text)
         
@@ -298,8 +339,7 @@ class AdvancedContentExtractor:
         # Look for testimonial sections
         for section in soup.find_all(['section', 'div', 'blockquote']):
             if section.get('class'):
-                classes = ' '.join(section.get('class'))
-                if any(word in classes.lower() for word in ['testimonial', 'review', 'feedback']):
+                if _TESTIMONIAL_CLASS_RE.search(' '.join(section.get('class'))):
                     text = section.get_text().strip()
                     if text and 20 < len(text) < 300:
                         testimonials.append(text)
@@ -312,16 +352,12 @@ class AdvancedContentExtractor:
         
         return testimonials[:3]
     
-    def _extract_offers(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_offers(self, strings: List[Tuple[str, str]]) -> List[str]:
         """Extract special offers/promotions."""
         offers = []
         
-        offer_keywords = ['special', 'offer', 'discount', 'save', 'promotion', 
-                         'deal', 'sale', '%', '$', 'off', 'free']
-        
-        for text in soup.stripped_strings:
-            text_lower = text.lower()
-            if any(keyword in text_lower for keyword in offer_keywords):
+        for text, text_lower in strings:
+            if _OFFER_KEYWORDS_RE.search(text_lower):
                 if len(text) < 150:
                     offers.append(text)
         
@@ -329,27 +365,18 @@ class AdvancedContentExtractor:
     
     def _calculate_confidence(self, content: ExtractedContent) -> float:
         """Calculate confidence score for extraction."""
-        score = 0.0
-        
-        # Base score from content
-        if content.main_content:
-            score += 0.3
-        if content.business_name:
-            score += 0.2
-        if content.contact_info:
-            score += 0.1
-        if content.owner_name:
-            score += 0.1
-        
-        # Bonus for personalization content
-        if content.recent_updates:
-            score += 0.1
-        if content.services_offered:
-            score += 0.1
-        if content.achievements or content.testimonials:
-            score += 0.1
-        
-        return min(score, 1.0)
+        signals = (
+            # Base score from content
+            (0.3, content.main_content),
+            (0.2, content.business_name),
+            (0.1, content.contact_info),
+            (0.1, content.owner_name),
+            # Bonus for personalization content
+            (0.1, content.recent_updates),
+            (0.1, content.services_offered),
+            (0.1, content.achievements or content.testimonials),
+        )
+        return min(sum(weight for weight, present in signals if present), 1.0)
     
     def extract_for_email_personalization(self, html_content: str, company_name: str) -> Dict[str, Any]:
         """
@@ -395,11 +422,8 @@ class AdvancedContentExtractor:
             )
         
         # Identify potential pain points from content
-        pain_keywords = ['challenge', 'difficult', 'problem', 'issue', 'struggle', 
-                        'concern', 'need', 'looking for', 'seeking']
-        
-        for text in content.raw_text.split('.'):
-            if any(keyword in text.lower() for keyword in pain_keywords):
+        for text in content.raw_text[:self.MAX_TEXT_LEN].split('.'):
+            if _PAIN_KEYWORDS_RE.search(text.lower()):
                 personalization['pain_points'].append(text.strip()[:150])
         
         return personalization
@@ -18,6 +18,18 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Rule-based patterns, compiled once at import
+_ENTITY_PATTERNS = {
+    'corporation': re.compile(r'\b(?:inc|incorporated|corp|corporation)\b\.?', re.IGNORECASE),
+    'llc': re.compile(r'\b(?:llc|l\.l\.c\.|limited\s+liability\s+company)\b', re.IGNORECASE),
+    'partnership': re.compile(r'\b(?:lp|llp|lllp|limited\s+partnership)\b', re.IGNORECASE),
+    'professional': re.compile(r'\b(?:pa|pc|pllc|p\.a\.|p\.c\.)\b', re.IGNORECASE)
+}
+_CORP_NAME_RE = re.compile(r'<div class="corporationName">([^<]+)</div>', re.IGNORECASE)
+_OFFICER_RE = re.compile(r'Title[:\s]+([A-Z]+).*?\n([^,]+,\s*[^\n]+)')
+_DBA_RE = re.compile(r'(?:dba|d/b/a|doing business as)[:\s]+([^,\n]+)', re.IGNORECASE)
+_DBA_SPLIT_RE = re.compile(r'\b(?:dba|d/b/a)\b', re.IGNORECASE)
+
 
 @dataclass
 class BusinessEntity:
@@ -41,6 +53,10 @@ class AIEntityExtractor:
     - GPT/Claude for complex reasoning
     """
     
+    # Longest input the regex rules scan; the lazy officer pattern can go
+    # quadratic on huge scraped pages, and the fields we want sit near the top
+    MAX_TEXT_LEN = 200_000
+    
     def __init__(self, use_llm: bool = False):
         """
         Initialize the extractor.
@@ -50,13 +66,8 @@ class AIEntityExtractor:
         """
         self.use_llm = use_llm
         
-        # Entity patterns for rule-based fallback
-        self.entity_patterns = {
-            'corporation': r'\b(?:inc|incorporated|corp|corporation)\b\.?',
-            'llc': r'\b(?:llc|l\.l\.c\.|limited\s+liability\s+company)\b',
-            'partnership': r'\b(?:lp|llp|lllp|limited\s+partnership)\b',
-            'professional': r'\b(?:pa|pc|pllc|p\.a\.|p\.c\.)\b'
-        }
+        # Entity patterns for rule-based fallback (compiled, case-insensitive)
+        self.entity_patterns = _ENTITY_PATTERNS
     
     def extract_from_html(self, html_content: str) -> BusinessEntity:
         """
@@ -70,25 +81,26 @@ class AIEntityExtractor:
         # For demonstration, using regex patterns
         # In production, use LangExtract or BeautifulSoup + NLP
         
+        html_content = html_content[:self.MAX_TEXT_LEN]
         entity = BusinessEntity(
             primary_name="",
             source_text=html_content[:500]
         )
         
         # Extract company name
-        name_pattern = r'<div class="corporationName">([^<]+)</div>'
-        name_match = re.search(name_pattern, html_content, re.IGNORECASE)
+        name_match = _CORP_NAME_RE.search(html_content)
         if name_match:
             entity.primary_name = name_match.group(1).strip()
         
         # Extract officers
-        officer_pattern = r'Title[:\s]+([A-Z]+).*?\n([^,]+,\s*[^\n]+)'
         officers = []
-        for match in re.finditer(officer_pattern, html_content):
-            officers.append({
-                'title': match.group(1),
-                'name': match.group(2).strip()
-            })
+        # The officer pattern is anchored on a literal 'Title'; skip the scan without one
+        if 'Title' in html_content:
+            for match in _OFFICER_RE.finditer(html_content):
+                officers.append({
+                    'title': match.group(1),
+                    'name': match.group(2).strip()
+                })
         entity.officers = officers
         
         return entity
@@ -135,6 +147,7 @@ class AIEntityExtractor:
         """
         Rule-based extraction as fallback.
         """
+        text = text[:self.MAX_TEXT_LEN]
         entity = BusinessEntity(
             primary_name="",
             source_text=text[:500]
@@ -145,18 +158,17 @@ class AIEntityExtractor:
         
         # Extract entity type
         for entity_type, pattern in self.entity_patterns.items():
-            if re.search(pattern, text_clean, re.IGNORECASE):
+            if pattern.search(text_clean):
                 entity.entity_type = entity_type.upper()
                 break
         
         # Extract DBA names
-        dba_pattern = r'(?:dba|d/b/a|doing business as)[:\s]+([^,\n]+)'
-        dba_matches = re.finditer(dba_pattern, text_clean, re.IGNORECASE)
+        dba_matches = _DBA_RE.finditer(text_clean)
         entity.dba_names = [m.group(1).strip() for m in dba_matches]
         
         # Extract primary name (before DBA)
         if entity.dba_names:
-            parts = re.split(r'\b(?:dba|d/b/a)\b', text_clean, flags=re.IGNORECASE)
+            parts = _DBA_SPLIT_RE.split(text_clean)
             if parts:
                 entity.primary_name = parts[0].strip()
         else:
@@ -62,12 +62,34 @@ async def lifespan(app: FastAPI):
     logger.info(f"LLM Model: {settings.LLM_MODEL}")
     logger.info(f"API Key configured: {'Yes' if settings.LLM_API_KEY else 'No'}")
     
+    # Start the shared browser in the background when enrichment scrapes with
+    # in-process Playwright, so the first job doesn't wait for Chromium
+    browser_manager = None
+    subprocess_wrapper = None
+    try:
+        from auto_enrich import web_scraper
+        gatherer_name = web_scraper.WebDataGatherer.__name__
+        if gatherer_name == 'PlaywrightWebGatherer':
+            from auto_enrich.playwright_browser_manager import browser_manager
+            browser_manager.start_warmup()
+            logger.info("Browser warmup started")
+        elif gatherer_name == 'WindowsPlaywrightGatherer':
+            # Scraping runs in the shared worker subprocess; stop it on shutdown
+            from auto_enrich.playwright_subprocess_wrapper_v2 import PlaywrightSubprocessWrapperV2 as subprocess_wrapper
+    except Exception as e:
+        logger.warning(f"Browser warmup skipped: {e}")
+    
     logger.info("Application startup complete")
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    if browser_manager is not None:
+        await browser_manager.cleanup()
+    if subprocess_wrapper is not None:
+        # Lets in-flight worker calls finish before the worker exits
+        await subprocess_wrapper.aclose()
     logger.info("Application shutdown complete")
 
 # Create FastAPI app
@@ -182,30 +204,35 @@ if __name__ == "__main__":
     @app.get("/api/v1/batch-monitor")
     async def get_batch_monitor():
         """Get batch processing monitor data"""
-        import subprocess
         import json
         from pathlib import Path
         
         try:
-            # Run the monitor script to get JSON data
-            result = subprocess.run(
-                ["python", "monitor_batch_advanced.py", "--once", "--json"],
-                capture_output=True,
-                text=True,
-                timeout=5
+            # Run the monitor script to get JSON data (async, so the event
+            # loop keeps serving other requests while it runs)
+            process = await asyncio.create_subprocess_exec(
+                "python", "monitor_batch_advanced.py", "--once", "--json",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return {"error": "Monitor script timed out", "process_running": False}
             
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
+            if process.returncode == 0:
+                data = json.loads(stdout.decode())
                 
                 # Add recent logs
                 log_file = Path("batch_processing.log")
                 if log_file.exists():
-                    logs = subprocess.run(
-                        ["tail", "-10", str(log_file)],
-                        capture_output=True,
-                        text=True
-                    ).stdout.split('\n')
+                    tail = await asyncio.create_subprocess_exec(
+                        "tail", "-10", str(log_file),
+                        stdout=asyncio.subprocess.PIPE
+                    )
+                    logs = (await tail.communicate())[0].decode().split('\n')
                     data['recent_logs'] = [line for line in logs if line.strip()]
                 
                 return data
@@ -218,10 +245,9 @@ if __name__ == "__main__":
     @app.post("/api/v1/batch-monitor/stop")
     async def stop_batch_monitor():
         """Stop the batch processing"""
-        import subprocess
-        
         try:
-            subprocess.run(["pkill", "-f", "simple_batch_processor"], check=False)
+            process = await asyncio.create_subprocess_exec("pkill", "-f", "simple_batch_processor")
+            await process.wait()
             return {"success": True, "message": "Stop signal sent"}
         except Exception as e:
             return {"success": False, "error": str(e)}
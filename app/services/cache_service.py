@@ -235,11 +235,11 @@ class CacheService:
         
         self._memory_cache[entry.key] = entry
     
-    def _is_entry_valid(self, entry: CacheEntry) -> bool:
-        """Check if cache entry is still valid."""
+    def _is_entry_valid(self, entry: CacheEntry, now: Optional[datetime] = None) -> bool:
+        """Check if cache entry is still valid (as of `now`, default the current time)."""
         if entry.expires_at is None:
             return True
-        return datetime.now() < entry.expires_at
+        return (now or datetime.now()) < entry.expires_at
     
     async def cleanup_expired(self) -> int:
         """Remove expired entries from cache. Returns number of entries removed."""
@@ -248,7 +248,7 @@ class CacheService:
         # Clean memory cache
         expired_keys = [
             key for key, entry in self._memory_cache.items()
-            if not self._is_entry_valid(entry)
+            if not self._is_entry_valid(entry, now)
         ]
         
         for key in expired_keys:
@@ -335,10 +335,11 @@ class JobService:
                 if job.status == JobStatus.PROCESSING and job.started_at:
                     remaining_records = job.total_records - job.processed_records - job.failed_records
                     if remaining_records > 0 and job.processed_records > 0:
-                        elapsed = datetime.now() - job.started_at
+                        now = datetime.now()
+                        elapsed = now - job.started_at
                         rate = job.processed_records / elapsed.total_seconds()  # records per second
                         remaining_seconds = remaining_records / rate if rate > 0 else 0
-                        estimated_completion = datetime.now() + timedelta(seconds=remaining_seconds)
+                        estimated_completion = now + timedelta(seconds=remaining_seconds)
                 
                 return JobStatusResponse(
                     job_id=job.id,
@@ -20,6 +20,27 @@ from .cache_service import get_cache_service
 
 logger = logging.getLogger(__name__)
 
+# Extraction patterns, compiled once at import instead of per call
+_INVALID_URL_RE = re.compile(
+    r'google\.|facebook\.|instagram\.|twitter\.|linkedin\.|youtube\.|yelp\.|wikipedia\.'
+)
+_PHONE_PATTERNS = (
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),  # XXX-XXX-XXXX or XXX.XXX.XXXX
+    re.compile(r'\(\d{3}\)\s*\d{3}[-.]?\d{4}'),    # (XXX) XXX-XXXX
+    re.compile(r'\b\d{3}\s+\d{3}\s+\d{4}\b'),      # XXX XXX XXXX
+)
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Common patterns indicating ownership/management
+_OWNER_NAME_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Owner:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
+        r'Manager:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
+        r'President:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
+        r'Founded by\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
+    )
+)
+
 
 @dataclass
 class ScrapingResult:
@@ -183,21 +204,9 @@ class EnhancedScraperService:
                 return None
         
         # Filter out obviously invalid domains
-        invalid_patterns = [
-            r'google\.',
-            r'facebook\.',
-            r'instagram\.',
-            r'twitter\.',
-            r'linkedin\.',
-            r'youtube\.',
-            r'yelp\.',
-            r'wikipedia\.'
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, url.lower()):
-                logger.debug(f"Filtered out invalid URL: {url}")
-                return None
+        if _INVALID_URL_RE.search(url.lower()):
+            logger.debug(f"Filtered out invalid URL: {url}")
+            return None
         
         return url
     
@@ -333,21 +342,14 @@ class EnhancedScraperService:
     
     def _extract_phone_numbers(self, text: str) -> List[str]:
         """Extract phone numbers from text using various patterns."""
-        patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # XXX-XXX-XXXX or XXX.XXX.XXXX
-            r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',    # (XXX) XXX-XXXX
-            r'\b\d{3}\s+\d{3}\s+\d{4}\b',      # XXX XXX XXXX
-        ]
-        
         phones = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            phones.extend(matches)
+        for pattern in _PHONE_PATTERNS:
+            phones.extend(pattern.findall(text))
         
         # Clean and validate phone numbers
         cleaned_phones = []
         for phone in phones:
-            cleaned = re.sub(r'[^\d]', '', phone)
+            cleaned = _NON_DIGIT_RE.sub('', phone)
             if len(cleaned) == 10:  # Valid US phone number
                 cleaned_phones.append(phone)
         
@@ -355,8 +357,7 @@ class EnhancedScraperService:
     
     def _extract_email_addresses(self, text: str) -> List[str]:
         """Extract email addresses from text."""
-        pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(pattern, text)
+        emails = _EMAIL_RE.findall(text)
         
         # Filter out common non-business emails
         filtered_emails = []
@@ -370,18 +371,10 @@ class EnhancedScraperService:
     
     def _extract_owner_names(self, text: str) -> Optional[str]:
         """Extract potential owner/manager names from text."""
-        # Look for common patterns indicating ownership/management
-        patterns = [
-            r'Owner:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'Manager:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'President:?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'Founded by\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0]
+        for pattern in _OWNER_NAME_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return match.group(1)
         
         return None
     
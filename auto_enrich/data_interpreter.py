@@ -334,7 +334,7 @@ class DataInterpreter:
                 'contact_info': profile.get('contact_info', {}),
                 'social_media': profile.get('social_media', {}),
                 'recent_activity': profile.get('recent_activity', [])[:5],
-                'pain_points': list(set(profile.get('pain_points', [])))[:7],
+                'pain_points': list(dict.fromkeys(profile.get('pain_points', [])))[:7],
                 'achievements': profile.get('achievements', [])[:5],
                 'reviews': profile.get('reviews', [])[:3],
                 'registry_data': profile.get('registry_data', {})
@@ -4,17 +4,145 @@ Uses markdownify for HTML to Markdown conversion for better AI processing.
 """
 
 import asyncio
+import copy
+import hashlib
 import json
 import logging
 import subprocess
 import sys
 import re
-from typing import Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
+from urllib.parse import urlparse
+
+import aiohttp
 from markdownify import markdownify as md
 
+from .http_session import create_pooled_session
+
+# Optional: libdeflate bindings decode gzip bodies faster than stdlib zlib
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+# Fetching the raw body needs the per-request auto_decompress kwarg (aiohttp>=3.10);
+# on older aiohttp the HTTP fallback lets aiohttp decode as usual
+_AIOHTTP_VERSION = tuple(int(part) for part in re.findall(r'\d+', aiohttp.__version__)[:2])
+_RAW_GZIP = deflate is not None and _AIOHTTP_VERSION >= (3, 10)
+
+# Optional: lxml parses HTML several times faster than the stdlib parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
 logger = logging.getLogger(__name__)
 
+# Contact and business-info patterns, compiled once at import
+_PHONE_PATTERNS = (
+    re.compile(r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b'),
+    re.compile(r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b'),
+)
+# Cheap pretest: every phone match contains a run of three digits
+_DIGIT_RUN_RE = re.compile(r'\d{3}')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_ADDRESS_RE = re.compile(
+    r'\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct)\b',
+    re.IGNORECASE
+)
+_HOURS_RE = re.compile(r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday).*?(?:am|pm|AM|PM)')
+_PRICE_RE = re.compile(r'\$[\d,]+(?:\.\d{2})?')
+_RATING_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:stars?|rating|★|☆)', re.IGNORECASE)
+_REVIEW_COUNT_RE = re.compile(r'(\d+)\s*(?:reviews?|ratings?)', re.IGNORECASE)
+
+# Hosts that serve complete server-rendered HTML (state business registries);
+# these go through the HTTP path first and only use Playwright if it comes up short
+_STATIC_HTTP_HOSTS = ('sunbiz.org', 'opencorporates.com', 'bizapedia.com')
+_STATIC_MIN_CHARS = 1500
+
+# LRU of (contacts, business_info) keyed by a digest of the analyzed text;
+# the same directory/website pages come back across retries and chain locations
+_ANALYSIS_CACHE_SIZE = 512
+_analysis_cache: "OrderedDict[bytes, Tuple[Dict[str, list], Dict[str, Any]]]" = OrderedDict()
+# _parse_content runs in worker threads, so cache bookkeeping is serialized
+_analysis_cache_lock = threading.Lock()
+
+# Successful extract() results by canonical URL, so the same directory/review
+# page shared by several companies in a run is fetched once per TTL. Entries
+# keep raw_html (the registry parser reads it), so the cache is also bounded
+# by the total characters held, not just the entry count.
+_EXTRACT_CACHE_SIZE = 128
+_EXTRACT_CACHE_MAX_CHARS = 32 * 1024 * 1024
+_EXTRACT_CACHE_TTL = 3600  # seconds
+_extract_cache: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_extract_cache_chars = 0
+
+
+def _content_chars(content: Dict[str, Any]) -> int:
+    """Approximate size of an extraction result (its two large text fields)."""
+    return len(content.get('raw_html') or '') + len(content.get('full_text') or '')
+
+
+def _extract_cache_pop(key: str) -> None:
+    """Drop one cached extraction and release its size from the budget."""
+    global _extract_cache_chars
+    _, chars, _ = _extract_cache.pop(key)
+    _extract_cache_chars -= chars
+
+
+def _extract_cache_put(key: str, content: Dict[str, Any]) -> None:
+    """Cache a copy of content, evicting least recently used entries to stay within both bounds."""
+    global _extract_cache_chars
+    chars = _content_chars(content)
+    if chars > _EXTRACT_CACHE_MAX_CHARS // 4:
+        return  # one outsized page shouldn't flush everything else
+    if key in _extract_cache:
+        _extract_cache_pop(key)
+    _extract_cache[key] = (time.monotonic(), chars, copy.deepcopy(content))
+    _extract_cache_chars += chars
+    while (len(_extract_cache) > _EXTRACT_CACHE_SIZE
+           or _extract_cache_chars > _EXTRACT_CACHE_MAX_CHARS):
+        _extract_cache_pop(next(iter(_extract_cache)))
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Lower-cased host of a URL; cached since directory/social URLs recur across companies."""
+    return urlparse(url).netloc.lower()
+
+
+@lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    """Cache key ignoring scheme, host case, www., fragment and trailing slash."""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower().removeprefix('www.')
+    path = parsed.path.rstrip('/')
+    return f"{host}{path}?{parsed.query}" if parsed.query else f"{host}{path}"
+
+
+def _html_to_markdown(html: str) -> str:
+    """Strip script/style elements and convert HTML to Markdown (CPU-bound)."""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, _HTML_PARSER)
+    
+    # Remove script and style elements
+    for script in soup(["script", "style", "meta", "link", "noscript"]):
+        script.decompose()
+    
+    # Convert HTML to Markdown for better AI processing
+    return md(str(soup),
+              heading_style="ATX",
+              bullets='-',
+              code_language='',
+              escape_misc=False)
+
 
 class EnhancedContentExtractor:
     """
@@ -23,9 +151,55 @@ class EnhancedContentExtractor:
     2. Basic HTTP fetch (last resort)
     """
     
-    def __init__(self):
-        """Initialize extractor with available methods."""
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize extractor with available methods.
+        
+        Args:
+            session: Shared aiohttp session for the HTTP fallback (created lazily if omitted)
+        """
         self.playwright_available = self._check_playwright_availability()
+        self._session = session
+        self._owns_session = session is None
+        # One Chromium shared by every extract(); each URL gets its own context
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = create_pooled_session()
+            self._owns_session = True
+        return self._session
+    
+    async def _ensure_browser(self):
+        """Get the shared Playwright browser, launching it on first use."""
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                from playwright.async_api import async_playwright
+                
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+    
+    async def aclose(self) -> None:
+        """Close the browser, and the HTTP session if this extractor created it."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+        async with self._browser_lock:
+            if self._browser is not None:
+                try:
+                    await self._browser.close()
+                except Exception as e:
+                    logger.debug(f"Error closing browser: {e}")
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
         
     def _check_playwright_availability(self) -> bool:
         """Check if Playwright is available."""
@@ -45,10 +219,38 @@ class EnhancedContentExtractor:
             url: URL to extract content from
             
         Returns:
-            Extracted content dictionary
+            Extracted content dictionary; always has the _parse_content keys,
+            with success False and empty text when every method failed
         """
+        key = _canonical_url(url)
+        cached = _extract_cache.get(key)
+        if cached is not None:
+            stored_at, _, content = cached
+            if time.monotonic() - stored_at < _EXTRACT_CACHE_TTL:
+                _extract_cache.move_to_end(key)
+                logger.info(f"Using cached extraction for: {url}")
+                content = copy.deepcopy(content)
+                content['url'] = url
+                return content
+            _extract_cache_pop(key)
+        
+        content = await self._extract_uncached(url)
+        if content['success']:
+            _extract_cache_put(key, content)
+        return content
+    
+    async def _extract_uncached(self, url: str) -> Dict[str, Any]:
+        """Run the extraction strategies for a URL (see extract)."""
         logger.info(f"Extracting content from: {url}")
         
+        # Static registry pages: a plain HTTP fetch is enough, skip the browser
+        http_content = None
+        if self._is_static_host(url):
+            http_content = await self._extract_with_http(url)
+            if self._is_complete_page(http_content):
+                logger.info(f"Successfully extracted static page with HTTP: {len(http_content['full_text'])} chars")
+                return http_content
+        
         # Try Playwright first (most reliable)
         if self.playwright_available:
             content = await self._extract_with_playwright(url)
@@ -58,53 +260,57 @@ class EnhancedContentExtractor:
             else:
                 logger.warning("Playwright returned empty content, trying final fallback")
         
-        # Final fallback - basic HTTP
-        content = await self._extract_with_http(url)
+        # Final fallback - basic HTTP (reusing the fast-path fetch if there was one)
+        content = http_content if http_content is not None else await self._extract_with_http(url)
         if content and content.get('text'):
             logger.info(f"Successfully extracted with HTTP: {len(content.get('text', ''))} chars")
-        else:
-            logger.error(f"All extraction methods failed for {url}")
+            return content
         
-        return content
+        logger.error(f"All extraction methods failed for {url}")
+        return self._empty_content(url)
+    
+    def _is_static_host(self, url: str) -> bool:
+        """Check whether the URL belongs to a known server-rendered registry host."""
+        host = _netloc(url)
+        return any(host == h or host.endswith('.' + h) for h in _STATIC_HTTP_HOSTS)
+    
+    def _is_complete_page(self, content: Dict[str, Any]) -> bool:
+        """Check that an HTTP fetch produced a full page rather than a loading shell."""
+        if not content:
+            return False
+        return (len(content['full_text']) > _STATIC_MIN_CHARS
+                and 'loading' not in content['text'][:200].lower())
     
     async def _extract_with_playwright(self, url: str) -> Dict[str, Any]:
         """Extract using Playwright browser."""
+        context = None
         try:
-            from playwright.async_api import async_playwright
+            browser = await self._ensure_browser()
+            context = await browser.new_context(
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            )
+            # Skip images, media and fonts - only text and HTML are extracted
+            from .playwright_browser_manager import block_heavy_resources
+            await context.route('**/*', block_heavy_resources)
+            page = await context.new_page()
             
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                )
-                page = await context.new_page()
-                
-                # Navigate to page
-                await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+            # Navigate to page
+            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+            try:
                 await page.wait_for_load_state('networkidle', timeout=5000)
-                
-                # Get full HTML content for registry parser
-                html_content = await page.content()
-                
-                # Clean HTML before conversion - remove script and style tags completely
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # Remove script and style elements
-                for script in soup(["script", "style", "meta", "link", "noscript"]):
-                    script.decompose()
-                
-                # Get cleaned HTML
-                cleaned_html = str(soup)
-                
-                # Convert HTML to Markdown for better AI processing
-                markdown_content = md(cleaned_html, 
-                                    heading_style="ATX",
-                                    bullets='-',
-                                    code_language='',
-                                    escape_misc=False)
-                
-                # Extract text content as fallback
+            except Exception:
+                pass  # Pages with long-polling never go idle; the DOM is already loaded
+            
+            # Get full HTML content for registry parser
+            html_content = await page.content()
+            
+            # Clean and convert to Markdown in a worker thread
+            markdown_content = await asyncio.to_thread(_html_to_markdown, html_content)
+            
+            # Extract text content as fallback - only needed (and only copied
+            # over CDP) when the Markdown conversion came back empty
+            text_content = ""
+            if not markdown_content:
                 text_content = await page.evaluate("""
                     () => {
                         // Remove scripts and styles
@@ -115,71 +321,80 @@ class EnhancedContentExtractor:
                         return document.body ? document.body.innerText : '';
                     }
                 """)
+            
+            # Extract title
+            title = await page.title()
+            
+            if markdown_content or text_content:
+                # Regex analysis of the page is CPU-bound; keep it off the event loop
+                return await asyncio.to_thread(
+                    self._parse_content,
+                    markdown_content or text_content,
+                    url, 
+                    "playwright", 
+                    title,
+                    raw_html=html_content
+                )
                 
-                # Extract title
-                title = await page.title()
-                
-                await browser.close()
-                
-                if markdown_content or text_content:
-                    return self._parse_content(
-                        markdown_content if markdown_content else text_content,
-                        url, 
-                        "playwright", 
-                        title,
-                        raw_html=html_content
-                    )
-                    
         except Exception as e:
             logger.error(f"Playwright extraction error: {e}")
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
         
         return {}
     
     async def _extract_with_http(self, url: str) -> Dict[str, Any]:
         """Basic HTTP extraction as final fallback."""
         try:
-            import aiohttp
+            session = await self._get_session()
+            
+            # With libdeflate available, take the raw gzip body and decode it ourselves
+            request_kwargs = {}
+            if _RAW_GZIP:
+                request_kwargs = {'headers': {'Accept-Encoding': 'gzip'}, 'auto_decompress': False}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
+            async with session.get(url, timeout=10, **request_kwargs) as response:
+                if response.status == 200:
+                    if _RAW_GZIP:
+                        html = self._decode_body(await response.read(), response)
+                    else:
                         html = await response.text()
+                    
+                    # Clean and convert to Markdown in a worker thread
+                    markdown_content = await asyncio.to_thread(_html_to_markdown, html)
+                    
+                    if markdown_content:
+                        return await asyncio.to_thread(
+                            self._parse_content,
+                            markdown_content[:10000], 
+                            url, 
+                            "http",
+                            raw_html=html
+                        )
                         
-                        # Clean HTML before conversion
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Remove script and style elements
-                        for script in soup(["script", "style", "meta", "link", "noscript"]):
-                            script.decompose()
-                        
-                        # Get cleaned HTML
-                        cleaned_html = str(soup)
-                        
-                        # Convert HTML to Markdown for better structure preservation
-                        markdown_content = md(cleaned_html, 
-                                            heading_style="ATX",
-                                            bullets='-',
-                                            code_language='',
-                                            escape_misc=False)
-                        
-                        if markdown_content:
-                            return self._parse_content(
-                                markdown_content[:10000], 
-                                url, 
-                                "http",
-                                raw_html=html
-                            )
-                            
         except Exception as e:
             logger.error(f"HTTP extraction error: {e}")
         
         return {}
     
+    def _decode_body(self, raw: bytes, response: aiohttp.ClientResponse) -> str:
+        """Decode a response body fetched with auto_decompress disabled."""
+        if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+            raw = deflate.gzip_decompress(raw)
+        # Same charset resolution response.text() would use
+        try:
+            return raw.decode(response.get_encoding(), errors='replace')
+        except (LookupError, RuntimeError):
+            return raw.decode('utf-8', errors='replace')
+    
     def _parse_content(self, text: str, url: str, source: str, title: str = "", raw_html: str = "") -> Dict[str, Any]:
         """Parse and structure extracted content."""
-        # Extract contact information
-        contacts = self._extract_contacts(text)
+        # Extract contact and business information (cached by content)
+        contacts, business_info = self._analyze_text(text)
         
         # Get title if not provided
         if not title:
@@ -189,8 +404,6 @@ class EnhancedContentExtractor:
                     title = line.strip()
                     break
         
-        # Extract business-specific information
-        business_info = self._extract_business_info(text)
         
         return {
             "text": text[:5000],  # Limit for processing
@@ -206,6 +419,41 @@ class EnhancedContentExtractor:
             "success": True
         }
     
+    def _empty_content(self, url: str) -> Dict[str, Any]:
+        """Failed extraction in the same shape as _parse_content output."""
+        return {
+            "text": "",
+            "full_text": "",
+            "raw_html": "",
+            "title": "",
+            "description": "",
+            "contact_info": {"phones": [], "emails": [], "addresses": []},
+            "business_info": {},
+            "url": url,
+            "source": "none",
+            "method": "none",
+            "success": False
+        }
+    
+    def _analyze_text(self, text: str) -> Tuple[Dict[str, list], Dict[str, Any]]:
+        """Run contact and business-info extraction, reusing results for repeated text."""
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with _analysis_cache_lock:
+            cached = _analysis_cache.get(key)
+            if cached is not None:
+                _analysis_cache.move_to_end(key)
+        
+        if cached is None:
+            # Analyze outside the lock so other threads aren't held up by the regex pass
+            cached = (self._extract_contacts(text), self._extract_business_info(text))
+            with _analysis_cache_lock:
+                _analysis_cache[key] = cached
+                if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                    _analysis_cache.popitem(last=False)
+        
+        # Callers own the returned dicts, so never hand out the cached ones
+        return copy.deepcopy(cached)
+    
     def _extract_contacts(self, text: str) -> Dict[str, list]:
         """Extract contact information from text."""
         contacts = {
@@ -214,24 +462,19 @@ class EnhancedContentExtractor:
             "addresses": []
         }
         
-        # Phone patterns
-        phone_patterns = [
-            r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b',
-            r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b'
-        ]
+        # Phone patterns (skipped outright when the text has no 3-digit run)
+        if _DIGIT_RUN_RE.search(text):
+            for pattern in _PHONE_PATTERNS:
+                phones = pattern.findall(text)
+                contacts["phones"].extend(phones[:5])
         
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            contacts["phones"].extend(phones[:5])
-        
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        contacts["emails"].extend(emails[:5])
+        # Email pattern (a C-level '@' probe before the regex pass)
+        if '@' in text:
+            emails = _EMAIL_RE.findall(text)
+            contacts["emails"].extend(emails[:5])
         
         # Address pattern (simplified)
-        address_pattern = r'\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct)\b'
-        addresses = re.findall(address_pattern, text, re.IGNORECASE)
+        addresses = _ADDRESS_RE.findall(text)
         contacts["addresses"].extend(addresses[:3])
         
         return contacts
@@ -240,28 +483,29 @@ class EnhancedContentExtractor:
         """Extract business-specific information."""
         info = {}
         
-        # Look for hours of operation
-        hours_pattern = r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday).*?(?:am|pm|AM|PM)'
-        hours = re.findall(hours_pattern, text)
-        if hours:
-            info["hours"] = hours[:7]
+        # Each field keeps only its first few matches, so stop scanning once
+        # those are found instead of collecting every match in the page
+        
+        # Look for hours of operation (every weekday name ends in 'day')
+        if 'day' in text:
+            hours = [m.group() for m in islice(_HOURS_RE.finditer(text), 7)]
+            if hours:
+                info["hours"] = hours
         
-        # Look for prices
-        price_pattern = r'\$[\d,]+(?:\.\d{2})?'
-        prices = re.findall(price_pattern, text)
-        if prices:
-            info["prices"] = prices[:10]
+        # Look for prices (a C-level '$' probe before the regex pass)
+        if '$' in text:
+            prices = [m.group() for m in islice(_PRICE_RE.finditer(text), 10)]
+            if prices:
+                info["prices"] = prices
         
         # Look for ratings
-        rating_pattern = r'(\d+(?:\.\d+)?)\s*(?:stars?|rating|★|☆)'
-        ratings = re.findall(rating_pattern, text, re.IGNORECASE)
+        ratings = [m.group(1) for m in islice(_RATING_RE.finditer(text), 5)]
         if ratings:
-            info["ratings"] = ratings[:5]
+            info["ratings"] = ratings
         
         # Look for review counts
-        review_pattern = r'(\d+)\s*(?:reviews?|ratings?)'
-        reviews = re.findall(review_pattern, text, re.IGNORECASE)
-        if reviews:
-            info["review_count"] = reviews[0]
+        review_match = _REVIEW_COUNT_RE.search(text)
+        if review_match:
+            info["review_count"] = review_match.group(1)
         
         return info
\ No newline at end of file
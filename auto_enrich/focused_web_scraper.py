@@ -11,13 +11,28 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+import aiohttp
+
 from .serper_client import SerperClient
 from .sunbiz_scraper import SunbizScraper
 from .enhanced_content_extractor import EnhancedContentExtractor
+from .http_session import create_pooled_session
 from .intelligent_web_navigator import IntelligentWebNavigator
 
 logger = logging.getLogger(__name__)
 
+# Confidence contributed by each populated result section
+_CONF_WEIGHTS = (
+    ('maps_data', 0.4),
+    ('website_content', 0.3),
+)
+
+# Confidence contributed by the owner, keyed by where it was found
+_OWNER_SOURCE_WEIGHTS = {
+    'authorized_person': 0.3,
+    'officer': 0.25,
+}
+
 
 class FocusedWebScraper:
     """
@@ -26,10 +41,20 @@ class FocusedWebScraper:
     
     def __init__(self):
         """Initialize the focused scraper with necessary components."""
-        self.serper = SerperClient()
+        # The Serper client and content extractor share one pooled HTTP
+        # session, created on first use inside the event loop
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self.serper: Optional[SerperClient] = None
+        self.content_extractor: Optional[EnhancedContentExtractor] = None
         self.sunbiz = SunbizScraper()
-        self.content_extractor = EnhancedContentExtractor()
         self.web_navigator = IntelligentWebNavigator(max_pages=12)
+    
+    def _ensure_http_clients(self) -> None:
+        """Create the shared HTTP session and the clients that use it (needs a running loop)."""
+        if self._http_session is None:
+            self._http_session = create_pooled_session()
+            self.serper = SerperClient(session=self._http_session)
+            self.content_extractor = EnhancedContentExtractor(session=self._http_session)
         
     async def gather_business_data(self, company_name: str, address: str, 
                                   city: str = None, state: str = None,
@@ -48,6 +73,7 @@ class FocusedWebScraper:
             Dictionary with all gathered business data
         """
         start_time = datetime.utcnow()
+        self._ensure_http_clients()
         
         # Build full address for better search results
         full_address = address
@@ -86,7 +112,6 @@ class FocusedWebScraper:
                 result['extracted_info']['hours'] = maps_data.get('hours')
                 result['extracted_info']['rating'] = maps_data.get('rating')
                 result['extracted_info']['business_type'] = maps_data.get('type')
-                result['confidence_score'] += 0.4
                 
                 logger.info(f"✅ [STEP 1] Maps SUCCESS - Website: {maps_data.get('website')}, Phone: {maps_data.get('phone')}, Rating: {maps_data.get('rating')}")
                 
@@ -123,7 +148,6 @@ class FocusedWebScraper:
                                 
                                 logger.info(f"Found {len(nav_results['team_members'])} team members on website")
                             
-                            result['confidence_score'] += 0.3
                             logger.info(f"✅ [STEP 2] Website SUCCESS - Scraped {nav_results['pages_scraped']} pages, "
                                        f"{nav_results['total_content_chars']} chars, Categories: {list(nav_results['content_by_category'].keys())}")
                         else:
@@ -173,7 +197,6 @@ class FocusedWebScraper:
                     'title': auth_person.get('title', ''),
                     'source': 'authorized_person'
                 }
-                result['confidence_score'] += 0.3
                 logger.info(f"Found {len(result['sunbiz_data']['authorized_persons'])} authorized persons (using as owner)")
                         
             elif result.get('sunbiz_data') and result['sunbiz_data'].get('officers'):
@@ -207,7 +230,6 @@ class FocusedWebScraper:
                     logger.info(f"Using first officer as owner: {officer.get('full_name', 'Unknown')}")
                 
                 if result['extracted_info'].get('owner_info'):
-                    result['confidence_score'] += 0.25
                     logger.info(f"Found {len(result['sunbiz_data']['officers'])} officers")
                     
             # Store all people as additional context (for AI to use in personalization)
@@ -230,13 +252,13 @@ class FocusedWebScraper:
             else:
                 logger.warning(f"No Sunbiz data found for: {company_name}")
             
-            # Calculate final confidence score
-            result['confidence_score'] = min(1.0, result['confidence_score'])
-            
         except Exception as e:
             logger.error(f"Error gathering business data: {e}")
             result['error'] = str(e)
         
+        # Calculate final confidence score from whatever was collected
+        result['confidence_score'] = self._calculate_confidence(result)
+        
         # Add processing time
         result['processing_time'] = (datetime.utcnow() - start_time).total_seconds()
         
@@ -244,7 +266,7 @@ class FocusedWebScraper:
         website = result['extracted_info'].get('website')
         owner_info = result['extracted_info'].get('owner_info', {})
         owner_name = owner_info.get('full_name', 'Not found')
-        content_chars = result.get('website_content', {}).get('total_chars', 0)
+        content_chars = (result.get('website_content') or {}).get('total_chars', 0)
         
         logger.info(f"📊 [FINAL] {company_name} Results:")
         logger.info(f"  🌐 Website: {website or 'Not found'}")
@@ -254,6 +276,21 @@ class FocusedWebScraper:
         logger.info(f"  ⏱️ Time: {result['processing_time']:.1f}s")
         
         return result
+    
+    def _calculate_confidence(self, result: Dict[str, Any]) -> float:
+        """Calculate confidence score from the populated result sections."""
+        confidence = sum(weight for key, weight in _CONF_WEIGHTS if result.get(key))
+        owner_source = result['extracted_info'].get('owner_info', {}).get('source')
+        confidence += _OWNER_SOURCE_WEIGHTS.get(owner_source, 0.0)
+        return min(1.0, confidence)
+    
+    async def aclose(self) -> None:
+        """Close pooled HTTP sessions and browsers held by the processors."""
+        processors = (self.serper, self.content_extractor, self.sunbiz)
+        await asyncio.gather(*(p.aclose() for p in processors if p is not None))
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
 
 
 # Create a compatibility wrapper for existing code
@@ -274,7 +311,7 @@ class FocusedWebGatherer:
     
     async def __aexit__(self, *args):
         """Async context manager exit."""
-        pass
+        await self.scraper.aclose()
     
     async def search_and_gather(self, company_name: str, location: str = "",
                                additional_data: Optional[Dict] = None,
@@ -0,0 +1,21 @@
+"""
+Pooled aiohttp session shared by the HTTP clients (Serper API, content fetches).
+"""
+
+import aiohttp
+
+
+def create_pooled_session() -> aiohttp.ClientSession:
+    """
+    Create a ClientSession with a keep-alive connection pool.
+
+    Must be called with an event loop running; owners create it lazily on
+    first use and pass it to every client via their `session=` argument.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=8,
+        ttl_dns_cache=300,
+        keepalive_timeout=30
+    )
+    return aiohttp.ClientSession(connector=connector)
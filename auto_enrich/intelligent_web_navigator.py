@@ -6,6 +6,7 @@ Automatically discovers and scrapes relevant pages while avoiding inventory.
 import asyncio
 import logging
 import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Set
 from urllib.parse import urljoin, urlparse
 from markdownify import markdownify as md
@@ -13,6 +14,77 @@ from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Use the lxml tree builder when it is installed (C parser, much faster on big pages)
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+_NON_CONTENT_TAGS = ["script", "style", "meta", "link", "noscript", "header", "footer", "nav"]
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# Emails and phones in one pass over the page; email is tried first so digits
+# inside an address's local part aren't also reported as a phone number
+_CONTACT_RE = re.compile(
+    r'(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<phone>\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+)
+_ADDRESS_RE = re.compile(
+    r'\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct)',
+    re.IGNORECASE
+)
+_HOURS_RE = re.compile(r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)[:\s]+[\d:apmAPM\s-]+')
+_MARKDOWN_EMPHASIS_RE = re.compile(r'[#*]')
+_LINE_PHONE_RE = re.compile(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}')
+
+
+@lru_cache(maxsize=4096)
+def _link_host_path(href: str) -> tuple:
+    """Lower-cased (host without www., path) of a link; nav links repeat on every page."""
+    parsed = urlparse(href)
+    host = parsed.netloc.lower()
+    return host.removeprefix('www.'), parsed.path.lower()
+
+
+# Query parameters that only track the click, never change the page
+_TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'msclkid'
+})
+
+
+@lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    """Dedupe key ignoring scheme, www., fragments, tracking params and trailing slashes."""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower().removeprefix('www.')
+    path = parsed.path.rstrip('/')
+    query = '&'.join(
+        param for param in parsed.query.split('&')
+        if param and param.split('=', 1)[0] not in _TRACKING_PARAMS
+    )
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def _html_to_markdown(html_content: str) -> str:
+    """Strip non-content elements and convert HTML to Markdown (CPU-bound)."""
+    soup = BeautifulSoup(html_content, _HTML_PARSER)
+    
+    # Remove script, style, and other non-content elements
+    for element in soup(_NON_CONTENT_TAGS):
+        element.decompose()
+    
+    # Convert cleaned HTML to markdown
+    markdown_content = md(str(soup),
+                          heading_style="ATX",
+                          bullets='-',
+                          code_language='',
+                          escape_misc=False)
+    
+    # Clean up excessive whitespace
+    return _EXCESS_NEWLINES_RE.sub('\n\n', markdown_content)
+
 
 class IntelligentWebNavigator:
     """
@@ -104,6 +176,15 @@ class IntelligentWebNavigator:
         r'\.png$'
     ]
     
+    # Compiled once at class creation; _find_target_pages runs these per link.
+    # Each category's patterns (and all avoid patterns) are fused into one
+    # alternation so a path is scanned once per category, not once per pattern.
+    _TARGET_RES = tuple(
+        (category, re.compile('|'.join(f'(?:{pattern})' for pattern in patterns)))
+        for category, patterns in TARGET_PATTERNS.items()
+    )
+    _AVOID_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in AVOID_PATTERNS))
+    
     def __init__(self, max_pages: int = 15, max_content_per_page: int = 20000):
         """
         Initialize the navigator.
@@ -114,7 +195,7 @@ class IntelligentWebNavigator:
         """
         self.max_pages = max_pages
         self.max_content_per_page = max_content_per_page
-        self.visited_urls: Set[str] = set()
+        self.visited_urls: Set[str] = set()  # _canonical_url keys
         self.stealth_enabled = True
         
     async def navigate_and_extract(self, base_url: str) -> Dict[str, Any]:
@@ -193,6 +274,10 @@ class IntelligentWebNavigator:
                     }
                 )
                 
+                # Skip images, media and fonts - pages are read for text and links only
+                from .playwright_browser_manager import block_heavy_resources
+                await context.route('**/*', block_heavy_resources)
+                
                 # Start with homepage
                 page = await context.new_page()
                 
@@ -210,28 +295,27 @@ class IntelligentWebNavigator:
                     results['all_content'].append(homepage_content)
                     results['pages_scraped'] += 1
                     results['total_content_chars'] += len(homepage_content.get('markdown', ''))
-                    self.visited_urls.add(base_url)
+                    self.visited_urls.add(_canonical_url(base_url))
                 
                 # Find target pages from discovered links
                 target_urls = self._find_target_pages(discovered_links)
                 
                 # Visit each target page
-                try:
-                    logger.info(f"Target URLs to visit: {{ {', '.join([f'{k}: {len(v)}' for k, v in target_urls.items()])} }}")
-                except Exception:
-                    pass
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Target URLs to visit: { %s }",
+                                ', '.join(f'{k}: {len(v)}' for k, v in target_urls.items()))
                 for category, urls in target_urls.items():
                     if results['pages_scraped'] >= self.max_pages:
                         break
                         
                     for url in urls[:2]:  # Max 2 pages per category
-                        if url in self.visited_urls:
+                        if _canonical_url(url) in self.visited_urls:
                             continue
                             
                         if results['pages_scraped'] >= self.max_pages:
                             break
                         
-                        logger.info(f"Visiting {category} page: {url}")
+                        logger.info("Visiting %s page: %s", category, url)
                         
                         try:
                             content, _ = await self._extract_page_with_links(
@@ -256,7 +340,12 @@ class IntelligentWebNavigator:
                                 
                                 results['pages_scraped'] += 1
                                 results['total_content_chars'] += len(content.get('markdown', ''))
-                                self.visited_urls.add(url)
+                                self.visited_urls.add(_canonical_url(url))
+                                
+                                # People are what team pages are for; once one
+                                # yields them, skip the second team page load
+                                if category == 'team' and results['team_members']:
+                                    break
                                 
                         except Exception as e:
                             logger.error(f"Error extracting {url}: {e}")
@@ -265,7 +354,7 @@ class IntelligentWebNavigator:
                 # Visit news/blog pages if we have room
                 if results['pages_scraped'] < self.max_pages and 'news' in target_urls:
                     for url in target_urls['news'][:3]:  # Get up to 3 recent news items
-                        if url in self.visited_urls:
+                        if _canonical_url(url) in self.visited_urls:
                             continue
                         if results['pages_scraped'] >= self.max_pages:
                             break
@@ -282,7 +371,7 @@ class IntelligentWebNavigator:
                                 results['all_content'].append(content)
                                 results['pages_scraped'] += 1
                                 results['total_content_chars'] += len(content.get('markdown', ''))
-                                self.visited_urls.add(url)
+                                self.visited_urls.add(_canonical_url(url))
                                 
                         except Exception as e:
                             logger.error(f"Error extracting news {url}: {e}")
@@ -325,12 +414,9 @@ class IntelligentWebNavigator:
             if self.stealth_enabled:
                 await self._simulate_human_behavior(page)
             
-            # Get page title
+            # Get page title (content is settled: DOM-stability and networkidle waits above)
             title = await page.title()
             
-            # Wait a bit more for dynamic content
-            await asyncio.sleep(2)
-            
             # Get all links on the page (including dynamically loaded)
             links = await page.evaluate("""
                 () => {
@@ -354,25 +440,9 @@ class IntelligentWebNavigator:
             # Get full HTML
             html_content = await page.content()
             
-            # Clean and convert to markdown
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove script, style, and other non-content elements
-            for element in soup(["script", "style", "meta", "link", "noscript", "header", "footer", "nav"]):
-                element.decompose()
-            
-            # Get cleaned HTML
-            cleaned_html = str(soup)
-            
-            # Convert to markdown
-            markdown_content = md(cleaned_html, 
-                                heading_style="ATX",
-                                bullets='-',
-                                code_language='',
-                                escape_misc=False)
-            
-            # Clean up excessive whitespace
-            markdown_content = re.sub(r'\n{3,}', '\n\n', markdown_content)
+            # Clean and convert to markdown off the event loop so other pages
+            # and requests keep moving while BeautifulSoup/markdownify run
+            markdown_content = await asyncio.to_thread(_html_to_markdown, html_content)
             
             # Check if content is too small (likely JavaScript-rendered)
             if len(markdown_content.strip()) < 500:
@@ -409,8 +479,10 @@ class IntelligentWebNavigator:
             Dictionary mapping categories to URLs
         """
         target_urls = {}
+        # Canonical keys already listed per category (x, x/, x?utm_source=... are one page)
+        seen_keys = {}
         
-        logger.info(f"Processing {len(links)} links (base_root={getattr(self, 'base_root', '')})")
+        logger.info("Processing %d links (base_root=%s)", len(links), getattr(self, 'base_root', ''))
 
         for link in links:
             if not link.get('href'):
@@ -418,39 +490,35 @@ class IntelligentWebNavigator:
                 
             href = link['href']
             text = link.get('text', '').lower()
+            # Link text only counts as a category hint when it is short
+            short_text = text if len(text) < 50 else ''
             
-            # Parse the URL path
-            from urllib.parse import urlparse
-            parsed = urlparse(href)
-            path = parsed.path.lower()
+            # Parse the URL host and path (cached per href)
+            host, path = _link_host_path(href)
             
             # Skip if it's an external link (different domain), allowing http/https and www variants
-            host = parsed.netloc.lower()
-            def _norm(h: str) -> str:
-                return h[4:] if h.startswith('www.') else h
-            if host and hasattr(self, 'base_root') and not _norm(host).endswith(self.base_root):
+            if host and hasattr(self, 'base_root') and not host.endswith(self.base_root):
                 continue
             
             # Skip if it matches avoid patterns
-            if any(re.search(pattern, path) for pattern in self.AVOID_PATTERNS):
+            if self._AVOID_RE.search(path):
                 continue
             
             # Check against target patterns
-            for category, patterns in self.TARGET_PATTERNS.items():
-                for pattern in patterns:
-                    if re.search(pattern, path) or (
-                        category in text and len(text) < 50
-                    ):
-                        if category not in target_urls:
-                            target_urls[category] = []
-                        if href not in target_urls[category]:
-                            target_urls[category].append(href)
-                        break
+            for category, pattern in self._TARGET_RES:
+                if category in short_text or pattern.search(path):
+                    if category not in target_urls:
+                        target_urls[category] = []
+                        seen_keys[category] = set()
+                    key = _canonical_url(href)
+                    if key not in seen_keys[category]:
+                        seen_keys[category].add(key)
+                        target_urls[category].append(href)
         
-        try:
-            logger.info(f"Found target pages: {{ {', '.join([f'{k}: {len(v)}' for k, v in target_urls.items()])} }}")
-        except Exception:
-            logger.info(f"Found target pages: {list(target_urls.keys())}")
+        # Only build the per-category summary when INFO is actually emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Found target pages: { %s }",
+                        ', '.join(f'{k}: {len(v)}' for k, v in target_urls.items()))
         
         return target_urls
     
@@ -473,7 +541,7 @@ class IntelligentWebNavigator:
             # Look for name patterns (usually in headers or bold)
             if line.startswith('#') or line.startswith('**'):
                 # Check if it looks like a person's name
-                clean_line = re.sub(r'[#*]', '', line).strip()
+                clean_line = _MARKDOWN_EMPHASIS_RE.sub('', line).strip()
                 if len(clean_line.split()) in [2, 3] and not any(
                     word in clean_line.lower() 
                     for word in ['team', 'staff', 'our', 'meet', 'the', 'page']
@@ -493,7 +561,7 @@ class IntelligentWebNavigator:
                     current_member['title'] = line
                     current_member['info'].append(line)
                 # Look for contact info
-                elif '@' in line or re.search(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}', line):
+                elif '@' in line or _LINE_PHONE_RE.search(line):
                     current_member['info'].append(line)
                 # Collect bio info (limit to 200 chars)
                 elif len(' '.join(current_member['info'])) < 200:
@@ -516,25 +584,25 @@ class IntelligentWebNavigator:
         
         text = content['markdown']
         
-        # Extract phone numbers
-        phones = re.findall(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
-        if phones:
-            contact['phones'] = list(set(phones))
+        # Extract phone numbers and email addresses in a single scan
+        found = {'phone': [], 'email': []}
+        for match in _CONTACT_RE.finditer(text):
+            found[match.lastgroup].append(match.group())
         
-        # Extract email addresses
-        emails = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
-        if emails:
-            contact['emails'] = list(set(emails))
+        # Order-preserving dedupe so the first number/address on the page leads
+        if found['phone']:
+            contact['phones'] = list(dict.fromkeys(found['phone']))
+        
+        if found['email']:
+            contact['emails'] = list(dict.fromkeys(found['email']))
         
         # Extract addresses
-        address_pattern = r'\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct)'
-        addresses = re.findall(address_pattern, text, re.IGNORECASE)
+        addresses = _ADDRESS_RE.findall(text)
         if addresses:
             contact['addresses'] = addresses[:2]  # Keep top 2
         
         # Extract hours
-        hours_pattern = r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)[:\s]+[\d:apmAPM\s-]+'
-        hours = re.findall(hours_pattern, text)
+        hours = _HOURS_RE.findall(text)
         if hours:
             contact['hours'] = hours
         
@@ -545,87 +613,99 @@ class IntelligentWebNavigator:
         Prioritize and combine content for AI processing.
         Target: ~80,000 chars (20,000 tokens)
         """
+        # Slices below are never guarded by a length check: CPython returns the
+        # original string object for a slice covering the whole string. The
+        # remaining budget is clamped at 0 since news items are counted as
+        # 2000 chars and can overshoot it, and a negative slice end would
+        # keep nearly the whole page.
         prioritized = []
         char_limit = 80000
         current_chars = 0
         
         # Priority 1: Team members (highest value)
         if results['team_members']:
-            team_text = "\n## TEAM MEMBERS\n"
+            team_parts = ["\n## TEAM MEMBERS\n"]
             for member in results['team_members'][:20]:  # Limit to 20 team members
-                team_text += f"- {member.get('name', 'Unknown')}"
+                team_parts.append(f"- {member.get('name', 'Unknown')}")
                 if member.get('title'):
-                    team_text += f" - {member['title']}"
+                    team_parts.append(f" - {member['title']}")
                 if member.get('info'):
-                    team_text += f" - {' '.join(member['info'][:2])}"
-                team_text += "\n"
+                    team_parts.append(f" - {' '.join(member['info'][:2])}")
+                team_parts.append("\n")
             
+            team_text = ''.join(team_parts)
             prioritized.append(team_text)
             current_chars += len(team_text)
         
         # Priority 2: About Us content
         if 'about' in results['content_by_category']:
-            about_content = "\n## ABOUT THE COMPANY\n"
+            about_parts = ["\n## ABOUT THE COMPANY\n"]
             for content in results['content_by_category']['about']:
-                if current_chars + len(content['markdown']) > char_limit:
-                    remaining = char_limit - current_chars
-                    about_content += content['markdown'][:remaining]
+                markdown = content['markdown']
+                markdown_len = len(markdown)
+                if current_chars + markdown_len > char_limit:
+                    remaining = max(0, char_limit - current_chars)
+                    about_parts.append(markdown[:remaining])
                     break
-                about_content += content['markdown']
-                about_content += "\n---\n"
+                about_parts.append(markdown)
+                about_parts.append("\n---\n")
             
+            about_content = ''.join(about_parts)
             prioritized.append(about_content)
             current_chars += len(about_content)
         
         # Priority 3: Recent news/community involvement
         if 'news' in results['content_by_category'] and current_chars < char_limit:
-            news_content = "\n## RECENT NEWS & COMMUNITY INVOLVEMENT\n"
+            news_parts = ["\n## RECENT NEWS & COMMUNITY INVOLVEMENT\n"]
             for content in results['content_by_category']['news'][:3]:
-                if current_chars + len(content['markdown']) > char_limit:
-                    remaining = char_limit - current_chars
-                    news_content += content['markdown'][:remaining]
+                markdown = content['markdown']
+                if current_chars + len(markdown) > char_limit:
+                    remaining = max(0, char_limit - current_chars)
+                    news_parts.append(markdown[:remaining])
                     break
-                news_content += f"### {content.get('title', 'News Item')}\n"
-                news_content += content['markdown'][:2000]  # Limit each news item
-                news_content += "\n---\n"
+                news_parts.append(f"### {content.get('title', 'News Item')}\n")
+                news_parts.append(markdown[:2000])  # Limit each news item
+                news_parts.append("\n---\n")
                 current_chars += 2000
             
-            prioritized.append(news_content)
+            prioritized.append(''.join(news_parts))
         
         # Priority 4: Community/charity work
         if 'community' in results['content_by_category'] and current_chars < char_limit:
-            community_content = "\n## COMMUNITY INVOLVEMENT\n"
+            community_parts = ["\n## COMMUNITY INVOLVEMENT\n"]
             for content in results['content_by_category']['community']:
-                if current_chars + len(content['markdown']) > char_limit:
-                    remaining = char_limit - current_chars
-                    community_content += content['markdown'][:remaining]
+                markdown = content['markdown']
+                markdown_len = len(markdown)
+                if current_chars + markdown_len > char_limit:
+                    remaining = max(0, char_limit - current_chars)
+                    community_parts.append(markdown[:remaining])
                     break
-                community_content += content['markdown']
-                current_chars += len(content['markdown'])
+                community_parts.append(markdown)
+                current_chars += markdown_len
             
-            prioritized.append(community_content)
+            prioritized.append(''.join(community_parts))
         
         # Priority 5: Testimonials
         if 'testimonials' in results['content_by_category'] and current_chars < char_limit:
-            testimonial_content = "\n## CUSTOMER TESTIMONIALS\n"
+            testimonial_parts = ["\n## CUSTOMER TESTIMONIALS\n"]
             for content in results['content_by_category']['testimonials']:
                 if current_chars + 3000 > char_limit:
                     break
-                testimonial_content += content['markdown'][:3000]
+                testimonial_parts.append(content['markdown'][:3000])
                 current_chars += 3000
             
-            prioritized.append(testimonial_content)
+            prioritized.append(''.join(testimonial_parts))
         
         # Priority 6: Services offered
         if 'services' in results['content_by_category'] and current_chars < char_limit:
-            services_content = "\n## SERVICES OFFERED\n"
+            services_parts = ["\n## SERVICES OFFERED\n"]
             for content in results['content_by_category']['services']:
                 if current_chars + 2000 > char_limit:
                     break
-                services_content += content['markdown'][:2000]
+                services_parts.append(content['markdown'][:2000])
                 current_chars += 2000
             
-            prioritized.append(services_content)
+            prioritized.append(''.join(services_parts))
         
         # Priority 7: Homepage content (if room)
         if 'homepage' in results['content_by_category'] and current_chars < char_limit:
@@ -896,7 +976,11 @@ class IntelligentWebNavigator:
             
             if framework_check:
                 logger.debug(f"Detected {framework_check} framework - waiting longer")
-                await asyncio.sleep(3)  # Extra wait for SPA frameworks
+                # Extra wait for SPA frameworks, but only until their requests settle
+                try:
+                    await page.wait_for_load_state('networkidle', timeout=3000)
+                except Exception:
+                    pass
             
             # Strategy 4: Monitor DOM mutations
             await page.evaluate("""() => {
@@ -943,9 +1027,6 @@ class IntelligentWebNavigator:
                 return Promise.all(promises);
             }""")
             
-            # Final safety wait
-            await asyncio.sleep(1)
-            
         except Exception as e:
             logger.debug(f"Intelligent wait error (non-critical): {e}")
             # Fallback to simple wait
@@ -968,8 +1049,10 @@ class IntelligentWebNavigator:
                 
                 for (const selector of contentSelectors) {
                     const element = document.querySelector(selector);
-                    if (element && element.innerText && element.innerText.trim().length > 100) {
-                        return element.innerText;
+                    // innerText forces layout, so read it once per element
+                    const text = element ? element.innerText : '';
+                    if (text && text.trim().length > 100) {
+                        return text;
                     }
                 }
                 
@@ -1012,8 +1095,9 @@ class IntelligentWebNavigator:
                 }""")
             
             if len(content) < 100:
-                # Method 3: Get all text nodes directly
-                content = await page.evaluate("""() => {
+                # Method 3: Get all text nodes directly, stopping in the page once
+                # there is enough text so only what we keep crosses the CDP pipe
+                content = await page.evaluate("""(maxChars) => {
                     const walker = document.createTreeWalker(
                         document.body,
                         NodeFilter.SHOW_TEXT,
@@ -1033,14 +1117,20 @@ class IntelligentWebNavigator:
                         }
                     );
                     
-                    let text = '';
+                    const parts = [];
+                    let size = 0;
                     let node;
                     while (node = walker.nextNode()) {
-                        text += node.nodeValue + ' ';
+                        parts.push(node.nodeValue);
+                        size += node.nodeValue.length + 1;
+                        // The caller truncates to maxChars anyway
+                        if (size >= maxChars) {
+                            break;
+                        }
                     }
                     
-                    return text;
-                }""")
+                    return parts.join(' ');
+                }""", self.max_content_per_page)
             
             if len(content) < 100:
                 # Method 4: Screenshot OCR fallback (indicate need for OCR)
@@ -7,19 +7,48 @@ It respects the processing configuration and executes only enabled steps.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+
+import aiohttp
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from .processing_config import ProcessingConfiguration
 from .serper_client import SerperClient
 from .sunbiz_scraper import SunbizScraper
 from .enhanced_content_extractor import EnhancedContentExtractor
+from .http_session import create_pooled_session
 from .intelligent_web_navigator import IntelligentWebNavigator
 from .social_media_scraper import SocialMediaScraper
 from .data_interpreter import interpret_scraped_data
 
 logger = logging.getLogger(__name__)
 
+# Confidence contributed by each successful step (see _calculate_confidence_score)
+_CONF_WEIGHTS = (
+    ('serper_maps', 0.3),
+    ('website_scraping', 0.2),
+    ('sunbiz_search', 0.3),
+    ('social_media_search', 0.1),
+    ('ai_content_generation', 0.1),
+)
+
+# Result keys holding per-step output; all empty means no step produced data
+_STEP_OUTPUT_KEYS = ('maps_data', 'website_content', 'sunbiz_data', 'social_media_data', 'generated_content')
+
+
+def _one_or_empty(value: Any) -> List[Any]:
+    """Wrap a single optional value in a list, or return [] if it's falsy."""
+    return [value] if value else []
+
+
+class CriticalStepFailure(Exception):
+    """Raised when a step marked critical fails or returns nothing, aborting the rest of the record."""
+    
+    def __init__(self, step_id: str, cause: Optional[Exception] = None):
+        self.step_id = step_id
+        self.cause = cause
+        super().__init__(f"Critical step {step_id} failed: {cause or 'no results returned'}")
+
 
 class ModularEnrichmentOrchestrator:
     """
@@ -32,7 +61,8 @@ class ModularEnrichmentOrchestrator:
         Initialize orchestrator with processing configuration.
         
         Args:
-            processing_config: Configuration dict with enabled_steps list
+            processing_config: Configuration dict with enabled_steps list and
+                optional critical_steps list
         """
         self.config = ProcessingConfiguration()
         
@@ -49,15 +79,52 @@ class ModularEnrichmentOrchestrator:
             
             self.config._update_enabled_steps()
         
-        # Initialize processors
-        self.serper = SerperClient()
+        # Mark steps whose hard failure should abort the rest of the record
+        if processing_config and processing_config.get('critical_steps'):
+            for step_id in processing_config['critical_steps']:
+                if step_id in self.config.steps:
+                    self.config.steps[step_id].critical = True
+        
+        # Initialize processors. The Serper client and content extractor share
+        # one pooled HTTP session, created on first use inside the event loop
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self.serper: Optional[SerperClient] = None
+        self.content_extractor: Optional[EnhancedContentExtractor] = None
         self.sunbiz = SunbizScraper()
-        self.content_extractor = EnhancedContentExtractor()
         self.web_navigator = IntelligentWebNavigator(max_pages=12)
         self.social_scraper = SocialMediaScraper()
         
         logger.info(f"🔧 Modular orchestrator initialized with {len(self.config.enabled_steps)} enabled steps: {list(self.config.enabled_steps)}")
     
+    def _new_result(self, company_name: str, address: str = '', phone: Optional[str] = None) -> Dict[str, Any]:
+        """Fresh result structure for one record."""
+        return {
+            'company_name': company_name,
+            'address': address,
+            'processing_steps_used': list(self.config.enabled_steps),
+            'maps_data': None,
+            'website_content': None,
+            'social_media_data': None,
+            'sunbiz_data': None,
+            'extracted_info': {
+                'website': None,
+                'phone': phone,
+                'hours': None,
+                'rating': None,
+                'owner_info': {},
+                'business_type': None
+            },
+            'confidence_score': 0.0,
+            'processing_time': 0
+        }
+    
+    def _ensure_http_clients(self) -> None:
+        """Create the shared HTTP session and the clients that use it (needs a running loop)."""
+        if self._http_session is None:
+            self._http_session = create_pooled_session()
+            self.serper = SerperClient(session=self._http_session)
+            self.content_extractor = EnhancedContentExtractor(session=self._http_session)
+    
     async def enrich_business_data(self, company_name: str, address: str = "",
                                  city: str = "", state: str = "", phone: str = "",
                                  additional_data: Optional[Dict] = None,
@@ -78,62 +145,64 @@ class ModularEnrichmentOrchestrator:
             Dictionary with enrichment results
         """
         start_time = datetime.utcnow()
+        self._ensure_http_clients()
         
         # Build full address for better search results
-        full_address = address
-        if city:
-            full_address += f", {city}"
-        if state:
-            full_address += f", {state}"
+        full_address = ", ".join(part for part in (address, city, state) if part)
         
         # Initialize result structure
-        result = {
-            'company_name': company_name,
-            'address': full_address,
-            'processing_steps_used': list(self.config.enabled_steps),
-            'maps_data': None,
-            'website_content': None,
-            'social_media_data': None,
-            'sunbiz_data': None,
-            'extracted_info': {
-                'website': None,
-                'phone': phone,
-                'hours': None,
-                'rating': None,
-                'owner_info': {},
-                'business_type': None
-            },
-            'confidence_score': 0.0,
-            'processing_time': 0
-        }
+        result = self._new_result(company_name, full_address, phone)
         
         # Execute processing steps in dependency order
         execution_order = self.config.get_processing_plan()
         logger.info(f"🚀 [START] Processing {company_name} with steps: {execution_order}")
         
         step_results = {}
+        scraped_data = None
         
-        for step_id in execution_order:
-            try:
-                step_start_time = datetime.utcnow()
-                step_result = await self._execute_processing_step(
-                    step_id, company_name, full_address, city, state, phone,
-                    additional_data, campaign_context, step_results
-                )
+        try:
+            for step_id in execution_order:
+                try:
+                    # AI generation always runs last, so everything it needs is in
+                    # step_results by now - consolidate once and hand it the package
+                    if step_id == 'ai_content_generation':
+                        result, scraped_data = self._consolidate_all(result, step_results, campaign_context)
+                
+                    step_start_time = datetime.utcnow()
+                    step_result = await self._execute_processing_step(
+                        step_id, company_name, full_address, city, state, phone,
+                        additional_data, campaign_context, step_results, scraped_data
+                    )
                 
-                if step_result:
-                    step_results[step_id] = step_result
-                    step_time = (datetime.utcnow() - step_start_time).total_seconds()
-                    logger.info(f"✅ [{step_id.upper()}] Completed in {step_time:.1f}s")
-                else:
-                    logger.warning(f"❌ [{step_id.upper()}] No results returned")
+                    if step_result:
+                        step_results[step_id] = step_result
+                        step_time = (datetime.utcnow() - step_start_time).total_seconds()
+                        logger.info(f"✅ [{step_id.upper()}] Completed in {step_time:.1f}s")
+                    else:
+                        logger.warning(f"❌ [{step_id.upper()}] No results returned")
+                        # Most steps swallow their own errors and return None
+                        if self.config.steps[step_id].critical:
+                            raise CriticalStepFailure(step_id)
                     
-            except Exception as e:
-                logger.error(f"❌ [{step_id.upper()}] Failed: {e}")
-                step_results[step_id] = {'error': str(e)}
-        
-        # Consolidate results from all executed steps
-        result = self._consolidate_step_results(result, step_results)
+                except CriticalStepFailure:
+                    raise
+                except Exception as e:
+                    # Failed steps stay out of step_results so neither consolidation
+                    # nor the confidence score counts them as completed
+                    logger.error(f"❌ [{step_id.upper()}] Failed: {e}")
+                    if self.config.steps[step_id].critical:
+                        raise CriticalStepFailure(step_id, e) from e
+        except CriticalStepFailure as e:
+            # Later steps would only spend API calls on a record we can't complete
+            logger.error(f"🛑 [ABORT] {e} - skipping remaining steps for {company_name}")
+            result['error'] = str(e)
+        
+        # Consolidate results from all executed steps (single pass)
+        if scraped_data is None:
+            # AI generation didn't run, so nothing needs the AI data package
+            result, _ = self._consolidate_all(result, step_results, build_ai_data=False)
+        elif step_results.get('ai_content_generation'):
+            self._apply_generated_content(result, step_results['ai_content_generation'])
         
         # Calculate final confidence score
         result['confidence_score'] = self._calculate_confidence_score(step_results)
@@ -148,7 +217,8 @@ class ModularEnrichmentOrchestrator:
                                      full_address: str, city: str, state: str, 
                                      phone: str, additional_data: Optional[Dict],
                                      campaign_context: Optional[Dict],
-                                     previous_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                                     previous_results: Dict[str, Any],
+                                     scraped_data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Execute a single processing step.
         
@@ -162,6 +232,7 @@ class ModularEnrichmentOrchestrator:
             additional_data: Additional input data
             campaign_context: Campaign context
             previous_results: Results from previous steps
+            scraped_data: Consolidated AI data package (ai_content_generation only)
             
         Returns:
             Results from this processing step
@@ -201,7 +272,7 @@ class ModularEnrichmentOrchestrator:
         elif step_id == 'ai_content_generation':
             # This step uses all available data
             return await self._execute_ai_content_generation(
-                company_name, previous_results, campaign_context
+                company_name, previous_results, campaign_context, scraped_data
             )
             
         elif step_id == 'contact_enrichment':
@@ -302,12 +373,15 @@ class ModularEnrichmentOrchestrator:
     
     async def _execute_ai_content_generation(self, company_name: str, 
                                            previous_results: Dict[str, Any],
-                                           campaign_context: Optional[Dict]) -> Optional[Dict[str, Any]]:
+                                           campaign_context: Optional[Dict],
+                                           scraped_data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Execute AI content generation using all available data."""
         logger.info(f"🤖 [AI_CONTENT_GENERATION] Generating content for: {company_name}")
         
-        # Build comprehensive data package for AI
-        scraped_data = self._build_scraped_data_for_ai(company_name, previous_results, campaign_context)
+        # Build comprehensive data package for AI unless the caller already consolidated it
+        if scraped_data is None:
+            _, scraped_data = self._consolidate_all(self._new_result(company_name),
+                                                    previous_results, campaign_context)
         
         try:
             interpreted_data = await interpret_scraped_data(scraped_data, campaign_context)
@@ -377,56 +451,122 @@ class ModularEnrichmentOrchestrator:
         
         return competitor_result
     
-    def _consolidate_step_results(self, base_result: Dict[str, Any], 
-                                step_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Consolidate results from all processing steps into final result."""
-        
-        # Maps data
-        if 'serper_maps' in step_results:
-            maps_data = step_results['serper_maps']
-            base_result['maps_data'] = maps_data
-            if maps_data:
-                base_result['extracted_info']['website'] = maps_data.get('website')
-                base_result['extracted_info']['phone'] = maps_data.get('phone') or base_result['extracted_info']['phone']
-                base_result['extracted_info']['hours'] = maps_data.get('hours')
-                base_result['extracted_info']['rating'] = maps_data.get('rating')
-                base_result['extracted_info']['business_type'] = maps_data.get('type')
-        
-        # Website data
-        if 'website_scraping' in step_results:
-            base_result['website_content'] = step_results['website_scraping']
-        
-        # Social media data
-        if 'social_media_search' in step_results:
-            base_result['social_media_data'] = step_results['social_media_search']
-        
-        # Sunbiz data and owner extraction
-        if 'sunbiz_search' in step_results:
-            sunbiz_data = step_results['sunbiz_search']
-            base_result['sunbiz_data'] = sunbiz_data
-            if sunbiz_data:
-                owner_info = self._extract_owner_from_sunbiz(sunbiz_data)
-                if owner_info:
-                    base_result['extracted_info']['owner_info'] = owner_info
-        
-        # AI generated content
-        if 'ai_content_generation' in step_results:
-            ai_data = step_results['ai_content_generation']
-            if ai_data:
-                base_result['generated_content'] = {
-                    'subject': ai_data.get('subject', ''),
-                    'icebreaker': ai_data.get('icebreaker', ''),
-                    'hot_button': ai_data.get('hot_button', ''),
-                    'confidence_scores': ai_data.get('confidence_scores', {})
-                }
+    def _consolidate_all(self, base_result: Dict[str, Any],
+                         step_results: Dict[str, Any],
+                         campaign_context: Optional[Dict] = None,
+                         build_ai_data: bool = True) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Consolidate step results into the final result and the AI data package.
+        
+        Walks step_results once and fills both structures side by side, so the
+        overlapping fields (website, phones, owner info) are only read once.
         
-        # Contact enrichment
-        if 'contact_enrichment' in step_results:
-            contact_data = step_results['contact_enrichment']
-            if contact_data:
-                base_result['contact_enrichment'] = contact_data
+        Args:
+            build_ai_data: Set False when AI generation won't run; the AI
+                package is then never materialized
+        
+        Returns:
+            Tuple of (base_result, scraped_data_for_ai or None)
+        """
+        extracted_info = base_result['extracted_info']
+        scraped_data = profile = contact_info = None
+        if build_ai_data:
+            scraped_data = {
+                'company_name': base_result['company_name'],
+                'search_engine': 'modular_orchestrator',
+                'website_found': False,
+                'website_url': None,
+                'website_data': {},
+                'campaign_context': campaign_context,  # Include campaign context for AI
+                'multi_source_profile': {
+                    'sources_used': [],
+                    'owner_info': {},
+                    'all_personnel': [],
+                    'business_details': {},
+                    'contact_info': {'phones': [], 'websites': [], 'emails': []},
+                    'combined_content': '',
+                    'social_context': {}
+                }
+            }
+            profile = scraped_data['multi_source_profile']
+            contact_info = profile['contact_info']
+        
+        for step_id, data in step_results.items():
+            if step_id == 'serper_maps':
+                base_result['maps_data'] = data
+                if data:
+                    website = data.get('website')
+                    maps_phone = data.get('phone')
+                    extracted_info['website'] = website
+                    extracted_info['phone'] = maps_phone or extracted_info['phone']
+                    extracted_info['hours'] = data.get('hours')
+                    extracted_info['rating'] = data.get('rating')
+                    extracted_info['business_type'] = data.get('type')
+                    
+                    if build_ai_data:
+                        scraped_data['website_found'] = bool(website)
+                        scraped_data['website_url'] = website
+                        profile['sources_used'].append('google_maps')
+                        profile['business_details'] = {
+                            'type': extracted_info['business_type'],
+                            'rating': extracted_info['rating'],
+                            'hours': extracted_info['hours']
+                        }
+                        if website:
+                            contact_info['websites'].append(website)
+                        if maps_phone:
+                            # Maps phone leads the list, ahead of any website phones
+                            contact_info['phones'].insert(0, maps_phone)
+            
+            elif step_id == 'website_scraping':
+                base_result['website_content'] = data
+                if data and build_ai_data:
+                    scraped_data['website_data'] = data
+                    profile['sources_used'].append('website_multi_page')
+                    profile['combined_content'] = data.get('prioritized_content', '')
+                    
+                    # Add contact info from website
+                    additional_contacts = data.get('additional_contacts', {})
+                    contact_info['emails'].extend(additional_contacts.get('emails', []))
+                    contact_info['phones'].extend(additional_contacts.get('phones', []))
+            
+            elif step_id == 'social_media_search':
+                base_result['social_media_data'] = data
+                if data and build_ai_data:
+                    profile['sources_used'].append('social_media')
+                    profile['social_context'] = data
+            
+            elif step_id == 'sunbiz_search':
+                # Sunbiz data and owner extraction
+                base_result['sunbiz_data'] = data
+                if data:
+                    owner_info = self._extract_owner_from_sunbiz(data)
+                    if owner_info:
+                        extracted_info['owner_info'] = owner_info
+                    if build_ai_data:
+                        profile['sources_used'].append('sunbiz')
+                        profile['registry_data'] = data
+                        if owner_info:
+                            profile['owner_info'] = owner_info
+            
+            elif step_id == 'ai_content_generation':
+                if data:
+                    self._apply_generated_content(base_result, data)
+            
+            elif step_id == 'contact_enrichment':
+                if data:
+                    base_result['contact_enrichment'] = data
         
-        return base_result
+        return base_result, scraped_data
+    
+    def _apply_generated_content(self, base_result: Dict[str, Any], ai_data: Dict[str, Any]) -> None:
+        """Copy AI generated content into the final result."""
+        base_result['generated_content'] = {
+            'subject': ai_data.get('subject', ''),
+            'icebreaker': ai_data.get('icebreaker', ''),
+            'hot_button': ai_data.get('hot_button', ''),
+            'confidence_scores': ai_data.get('confidence_scores', {})
+        }
     
     def _extract_owner_from_sunbiz(self, sunbiz_data: Dict[str, Any]) -> Optional[Dict[str, str]]:
         """Extract owner information from Sunbiz data."""
@@ -464,101 +604,27 @@ class ModularEnrichmentOrchestrator:
                 }
         return None
     
-    def _build_scraped_data_for_ai(self, company_name: str, 
-                                 step_results: Dict[str, Any],
-                                 campaign_context: Optional[Dict] = None) -> Dict[str, Any]:
-        """Build scraped data structure for AI processing."""
-        scraped_data = {
-            'company_name': company_name,
-            'search_engine': 'modular_orchestrator',
-            'website_found': False,
-            'website_url': None,
-            'website_data': {},
-            'campaign_context': campaign_context,  # Include campaign context for AI
-            'multi_source_profile': {
-                'sources_used': [],
-                'owner_info': {},
-                'all_personnel': [],
-                'business_details': {},
-                'contact_info': {'phones': [], 'websites': [], 'emails': []},
-                'combined_content': '',
-                'social_context': {}
-            }
-        }
-        
-        # Add data from each completed step
-        if 'serper_maps' in step_results and step_results['serper_maps']:
-            maps_data = step_results['serper_maps']
-            scraped_data['website_found'] = bool(maps_data.get('website'))
-            scraped_data['website_url'] = maps_data.get('website')
-            scraped_data['multi_source_profile']['sources_used'].append('google_maps')
-            scraped_data['multi_source_profile']['business_details'] = {
-                'type': maps_data.get('type'),
-                'rating': maps_data.get('rating'),
-                'hours': maps_data.get('hours')
-            }
-            if maps_data.get('website'):
-                scraped_data['multi_source_profile']['contact_info']['websites'].append(maps_data['website'])
-            if maps_data.get('phone'):
-                scraped_data['multi_source_profile']['contact_info']['phones'].append(maps_data['phone'])
-        
-        if 'website_scraping' in step_results and step_results['website_scraping']:
-            website_data = step_results['website_scraping']
-            scraped_data['website_data'] = website_data
-            scraped_data['multi_source_profile']['sources_used'].append('website_multi_page')
-            scraped_data['multi_source_profile']['combined_content'] = website_data.get('prioritized_content', '')
-            
-            # Add contact info from website
-            additional_contacts = website_data.get('additional_contacts', {})
-            scraped_data['multi_source_profile']['contact_info']['emails'].extend(
-                additional_contacts.get('emails', [])
-            )
-            scraped_data['multi_source_profile']['contact_info']['phones'].extend(
-                additional_contacts.get('phones', [])
-            )
-        
-        if 'sunbiz_search' in step_results and step_results['sunbiz_search']:
-            sunbiz_data = step_results['sunbiz_search']
-            scraped_data['multi_source_profile']['sources_used'].append('sunbiz')
-            scraped_data['multi_source_profile']['registry_data'] = sunbiz_data
-            
-            # Extract owner info
-            owner_info = self._extract_owner_from_sunbiz(sunbiz_data)
-            if owner_info:
-                scraped_data['multi_source_profile']['owner_info'] = owner_info
-        
-        if 'social_media_search' in step_results and step_results['social_media_search']:
-            social_data = step_results['social_media_search']
-            scraped_data['multi_source_profile']['sources_used'].append('social_media')
-            scraped_data['multi_source_profile']['social_context'] = social_data
-        
-        return scraped_data
-    
     def _calculate_confidence_score(self, step_results: Dict[str, Any]) -> float:
         """Calculate overall confidence score based on completed steps."""
         confidence = 0.0
         
-        # Each successful step adds to confidence
-        if 'serper_maps' in step_results and step_results['serper_maps']:
-            confidence += 0.3
-        if 'website_scraping' in step_results and step_results['website_scraping']:
-            confidence += 0.2
-        if 'sunbiz_search' in step_results and step_results['sunbiz_search']:
-            confidence += 0.3
-        if 'social_media_search' in step_results and step_results['social_media_search']:
-            confidence += 0.1
-        if 'ai_content_generation' in step_results and step_results['ai_content_generation']:
-            confidence += 0.1
-        
-        return min(1.0, confidence)
+        # Each successful step adds its weight; stop once the score saturates
+        for step_id, weight in _CONF_WEIGHTS:
+            if step_results.get(step_id):
+                confidence += weight
+                if confidence >= 1.0:
+                    return 1.0
+        
+        return confidence
     
     def _log_enrichment_summary(self, result: Dict[str, Any]) -> None:
         """Log final enrichment summary."""
         website = result['extracted_info'].get('website')
         owner_info = result['extracted_info'].get('owner_info', {})
         owner_name = owner_info.get('full_name', 'Not found')
-        content_chars = result.get('website_content', {}).get('total_chars', 0)
-        social_profiles = len(result.get('social_media_data', {}).get('active_platforms', []))
+        # Step outputs are None (not missing) when a step was skipped or aborted
+        content_chars = (result.get('website_content') or {}).get('total_chars', 0)
+        social_profiles = len((result.get('social_media_data') or {}).get('active_platforms', []))
         
         logger.info(f"📊 [FINAL] {result['company_name']} Results:")
         logger.info(f"  🌐 Website: {website or 'Not found'}")
@@ -568,6 +634,14 @@ class ModularEnrichmentOrchestrator:
         logger.info(f"  ⭐ Confidence: {result['confidence_score']:.1%}")
         logger.info(f"  ⏱️ Time: {result['processing_time']:.1f}s")
         logger.info(f"  🔧 Steps Used: {result['processing_steps_used']}")
+    
+    async def aclose(self) -> None:
+        """Close pooled HTTP sessions and browsers held by the processors."""
+        processors = (self.serper, self.content_extractor, self.social_scraper, self.sunbiz)
+        await asyncio.gather(*(p.aclose() for p in processors if p is not None))
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
 
 
 # Compatibility wrapper for existing code
@@ -587,7 +661,7 @@ class ModularWebGatherer:
     
     async def __aexit__(self, *args):
         """Async context manager exit."""
-        pass
+        await self.orchestrator.aclose()
     
     async def search_and_gather(self, company_name: str, location: str = "",
                                additional_data: Optional[Dict] = None,
@@ -626,59 +700,110 @@ class ModularWebGatherer:
     def _format_for_compatibility(self, modular_result: Dict) -> Dict[str, Any]:
         """
         Format modular result to be compatible with existing enricher.py code.
-        """
-        extracted_info = modular_result.get('extracted_info', {})
         
+        Returns a plain dict rather than a read-only view because enricher.py
+        adds keys (e.g. campaign_context) to it.
+        """
+        # Bind the .get methods once; the literal below calls them repeatedly
+        result_get = modular_result.get
+        
+        # Fast path: the record failed before any step produced data, so there
+        # is nothing to pull out of the step outputs
+        error = result_get('error')
+        if error and not any(result_get(key) for key in _STEP_OUTPUT_KEYS):
+            return self._format_failed_result(modular_result, error)
+        
+        extracted_info = result_get('extracted_info') or {}
+        info_get = extracted_info.get
+        # Skipped steps leave None behind, so normalize once and read from the local
+        website_content = result_get('website_content') or {}
+        content_get = website_content.get
+        additional_contacts = content_get('additional_contacts') or {}
+        website = info_get('website')
+        phone = info_get('phone')
+        
+        # Built as one literal from the locals above so every section is sized
+        # exactly once; nothing is added to it key-by-key afterwards. Keep the
+        # sections as constant-key literals - dict(zip(KEYS, values)) measured
+        # ~3x slower for the 3-key business_details section.
         formatted = {
-            'company_name': modular_result.get('company_name'),
-            'location': modular_result.get('address'),
+            'company_name': result_get('company_name'),
+            'location': result_get('address'),
             'search_engine': 'modular_orchestrator',
-            'website_found': bool(extracted_info.get('website')),
-            'website_url': extracted_info.get('website'),
-            'website_data': modular_result.get('website_content', {}),
+            'website_found': bool(website),
+            'website_url': website,
+            'website_data': website_content,
             
             # Multi-source profile with modular data
             'multi_source_profile': {
-                'sources_used': modular_result.get('processing_steps_used', []),
-                'urls_scraped': modular_result.get('website_content', {}).get('pages_scraped', 0),
-                'total_content_chars': modular_result.get('website_content', {}).get('total_chars', 0),
+                'sources_used': result_get('processing_steps_used') or [],
+                'urls_scraped': content_get('pages_scraped', 0),
+                'total_content_chars': content_get('total_chars', 0),
                 
                 # Owner information
-                'owner_info': extracted_info.get('owner_info', {}),
+                'owner_info': info_get('owner_info') or {},
                 
                 # Business details from Maps
                 'business_details': {
-                    'type': extracted_info.get('business_type'),
-                    'rating': extracted_info.get('rating'),
-                    'hours': extracted_info.get('hours')
+                    'type': info_get('business_type'),
+                    'rating': info_get('rating'),
+                    'hours': info_get('hours')
                 },
                 
                 # Contact information
                 'contact_info': {
-                    'phones': [extracted_info.get('phone')] if extracted_info.get('phone') else [],
-                    'websites': [extracted_info.get('website')] if extracted_info.get('website') else [],
-                    'emails': modular_result.get('website_content', {}).get('additional_contacts', {}).get('emails', [])
+                    'phones': _one_or_empty(phone),
+                    'websites': _one_or_empty(website),
+                    'emails': additional_contacts.get('emails', [])
                 },
                 
                 # Team members from website
-                'team_members': modular_result.get('website_content', {}).get('team_members', []),
+                'team_members': content_get('team_members', []),
                 
                 # Combined content for AI processing
-                'combined_content': modular_result.get('website_content', {}).get('prioritized_content', ''),
+                'combined_content': content_get('prioritized_content', ''),
                 
                 # Registry data from Sunbiz
-                'registry_data': modular_result.get('sunbiz_data', {}),
+                'registry_data': result_get('sunbiz_data') or {},
                 
                 # Social media context
-                'social_context': modular_result.get('social_media_data', {})
+                'social_context': result_get('social_media_data') or {}
             },
             
             # Generated content from AI
-            'generated_content': modular_result.get('generated_content', {}),
+            'generated_content': result_get('generated_content') or {},
             
-            'confidence_score': modular_result.get('confidence_score', 0.0),
-            'processing_time': modular_result.get('processing_time', 0),
-            'error': modular_result.get('error')
+            'confidence_score': result_get('confidence_score', 0.0),
+            'processing_time': result_get('processing_time', 0),
+            'error': error
         }
         
-        return formatted
\ No newline at end of file
+        return formatted
+    
+    def _format_failed_result(self, modular_result: Dict, error: str) -> Dict[str, Any]:
+        """Compatibility result for a record where no processing step returned data."""
+        phone = (modular_result.get('extracted_info') or {}).get('phone')
+        return {
+            'company_name': modular_result.get('company_name'),
+            'location': modular_result.get('address'),
+            'search_engine': 'modular_orchestrator',
+            'website_found': False,
+            'website_url': None,
+            'website_data': {},
+            'multi_source_profile': {
+                'sources_used': modular_result.get('processing_steps_used') or [],
+                'urls_scraped': 0,
+                'total_content_chars': 0,
+                'owner_info': {},
+                'business_details': {'type': None, 'rating': None, 'hours': None},
+                'contact_info': {'phones': _one_or_empty(phone), 'websites': [], 'emails': []},
+                'team_members': [],
+                'combined_content': '',
+                'registry_data': {},
+                'social_context': {}
+            },
+            'generated_content': {},
+            'confidence_score': 0.0,
+            'processing_time': modular_result.get('processing_time', 0),
+            'error': error
+        }
\ No newline at end of file
@@ -7,6 +7,7 @@ import asyncio
 import sys
 import random
 import logging
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
@@ -22,6 +23,161 @@ if sys.platform == 'win32':
 logger = logging.getLogger(__name__)
 
 
+# Fingerprint choices, built once; every context creation picks from these
+_USER_AGENTS = (
+    # Chrome on Windows
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    # Chrome on Mac
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    # Firefox on Windows
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
+    # Edge on Windows
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+)
+_GEOLOCATIONS = (
+    {'latitude': 40.7128, 'longitude': -74.0060},   # New York
+    {'latitude': 34.0522, 'longitude': -118.2437},  # Los Angeles
+    {'latitude': 41.8781, 'longitude': -87.6298},   # Chicago
+    {'latitude': 29.7604, 'longitude': -95.3698},   # Houston
+    {'latitude': 33.4484, 'longitude': -112.0740},  # Phoenix
+    {'latitude': 39.7392, 'longitude': -104.9903},  # Denver
+    {'latitude': 47.6062, 'longitude': -122.3321},  # Seattle
+    {'latitude': 25.7617, 'longitude': -80.1918},   # Miami
+)
+_LOCALES = ('en-US', 'en-GB', 'en-CA')
+_TIMEZONES = (
+    'America/New_York',
+    'America/Chicago',
+    'America/Los_Angeles',
+    'America/Denver',
+)
+_COLOR_SCHEMES = ('light', 'dark', 'no-preference')
+
+# Browser launch arguments for stealth mode
+_STEALTH_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-accelerated-2d-canvas',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+    '--start-maximized',
+    '--disable-infobars',
+    '--disable-notifications',
+    '--disable-popup-blocking',
+    '--ignore-certificate-errors',
+    '--allow-running-insecure-content',
+)
+
+_STEALTH_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+# Anti-detection script injected into every context before page scripts run
+_STEALTH_JS = """
+// Override navigator.webdriver
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
+
+// Override navigator.plugins to look realistic
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5].map(i => ({
+        name: `Plugin ${i}`,
+        description: `Description ${i}`,
+        filename: `plugin${i}.dll`,
+        length: 1
+    }))
+});
+
+// Override navigator.languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en']
+});
+
+// Add chrome object
+if (!window.chrome) {
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+}
+
+// Override permissions
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+);
+
+// Canvas fingerprinting protection
+const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+HTMLCanvasElement.prototype.toDataURL = function(type) {
+    if (type === 'image/png' && this.width === 280 && this.height === 60) {
+        // Return fake canvas fingerprint
+        return 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==';
+    }
+    return originalToDataURL.apply(this, arguments);
+};
+
+// WebGL fingerprinting protection
+const getParameter = WebGLRenderingContext.prototype.getParameter;
+WebGLRenderingContext.prototype.getParameter = function(parameter) {
+    if (parameter === 37445) {
+        return 'Intel Inc.';
+    }
+    if (parameter === 37446) {
+        return 'Intel Iris OpenGL Engine';
+    }
+    return getParameter.apply(this, arguments);
+};
+
+// Battery API protection
+if (navigator.getBattery) {
+    navigator.getBattery = () => Promise.resolve({
+        charging: true,
+        chargingTime: 0,
+        dischargingTime: Infinity,
+        level: 1
+    });
+}
+
+// Hardware concurrency randomization
+Object.defineProperty(navigator, 'hardwareConcurrency', {
+    get: () => 4 + Math.floor(Math.random() * 4)
+});
+
+// Device memory
+Object.defineProperty(navigator, 'deviceMemory', {
+    get: () => 8
+});
+
+// Max touch points
+Object.defineProperty(navigator, 'maxTouchPoints', {
+    get: () => 0
+});
+"""
+
+
 class BrowserManager:
     """
     Singleton browser manager that maintains a single browser instance
@@ -31,17 +187,56 @@ class BrowserManager:
     """
     
     _instance = None
-    _lock = asyncio.Lock()
-    _playwright: Optional[Playwright] = None
-    _browser: Optional[Browser] = None
-    _contexts: Dict[str, BrowserContext] = {}
-    _pages: Dict[str, Page] = {}
+    # Contexts kept open at once; idle ones beyond this are closed LRU-first
+    # (each Chromium context holds tens of MB, and callers key them per URL)
+    max_contexts = 8
+    _lock: Optional[asyncio.Lock]
+    _playwright: Optional[Playwright]
+    _browser: Optional[Browser]
+    _contexts: "OrderedDict[str, BrowserContext]"
+    _pages: Dict[str, Page]
+    _init_task: Optional[asyncio.Task]
+    _creating: Dict[Any, asyncio.Future]
+    _checkouts: Dict[str, int]
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            # Per-instance state; the lock is created inside the running loop
+            # on first use rather than at import, when no loop exists yet
+            instance._lock = None
+            instance._playwright = None
+            instance._browser = None
+            instance._contexts = OrderedDict()
+            instance._pages = {}
+            instance._init_task = None
+            instance._creating = {}
+            # context_id -> callers/pages still using it; never evicted while > 0
+            instance._checkouts = {}
+            cls._instance = instance
         return cls._instance
     
+    def start_warmup(self, headless: bool = True) -> None:
+        """
+        Launch the browser in the background (e.g. at application startup)
+        so the first scrape doesn't wait for Chromium to start.
+        """
+        if self._browser is None and (self._init_task is None or self._init_task.done()):
+            self._init_task = asyncio.create_task(self.initialize(headless=headless))
+    
+    async def _ensure_browser(self) -> None:
+        """Wait for an in-flight warmup, or initialize inline if there is none."""
+        if self._browser is not None:
+            return
+        if self._init_task is not None and not self._init_task.done():
+            try:
+                # Shielded so a cancelled caller doesn't abort the shared launch
+                await asyncio.shield(self._init_task)
+            except Exception as e:
+                logger.warning(f"Browser warmup failed, retrying inline: {e}")
+        if self._browser is None:
+            await self.initialize()
+    
     async def initialize(self, headless: bool = True, proxy_list: Optional[List[str]] = None):
         """
         Initialize the browser with anti-detection measures.
@@ -50,6 +245,12 @@ class BrowserManager:
             headless: MUST be True in production to prevent window spam
             proxy_list: Optional list of proxy servers
         """
+        # Fast path once launched: callers don't queue on the lock
+        if self._browser is not None:
+            return
+        
+        if self._lock is None:
+            self._lock = asyncio.Lock()
         async with self._lock:
             if self._browser is not None:
                 logger.debug("Browser already initialized, reusing existing instance")
@@ -76,58 +277,81 @@ class BrowserManager:
     
     def _get_stealth_args(self) -> List[str]:
         """Get browser launch arguments for stealth mode."""
-        return [
-            '--disable-blink-features=AutomationControlled',
-            '--disable-dev-shm-usage',
-            '--disable-web-security',
-            '--disable-features=IsolateOrigins,site-per-process',
-            '--no-sandbox',
-            '--disable-setuid-sandbox',
-            '--disable-accelerated-2d-canvas',
-            '--disable-gpu',
-            '--window-size=1920,1080',
-            '--start-maximized',
-            '--disable-infobars',
-            '--disable-notifications',
-            '--disable-popup-blocking',
-            '--ignore-certificate-errors',
-            '--allow-running-insecure-content'
-        ]
+        return list(_STEALTH_ARGS)
     
     async def create_stealth_context(self, context_id: str = 'default',
-                                   proxy: Optional[str] = None) -> BrowserContext:
+                                   proxy: Optional[str] = None,
+                                   block_resources: bool = True) -> BrowserContext:
         """
         Create a new browser context with anti-detection features.
         
+        The context is checked out to the caller and won't be evicted until
+        release_context() is called (get_page() handles this itself).
+        
         Args:
             context_id: Unique identifier for the context
             proxy: Optional proxy server URL
+            block_resources: Abort image/media/font requests (scraping never
+                reads them); pass False for flows that need a full render
             
         Returns:
             Configured browser context
         """
-        if not self._browser:
-            await self.initialize()
-        
-        # Check if context already exists
-        if context_id in self._contexts:
-            logger.debug(f"Reusing existing context: {context_id}")
-            return self._contexts[context_id]
+        # Checked out before any await so eviction can't close it under us
+        self._checkout(context_id)
+        try:
+            await self._ensure_browser()
+            
+            # Check if context already exists
+            if context_id in self._contexts:
+                logger.debug(f"Reusing existing context: {context_id}")
+                self._contexts.move_to_end(context_id)
+                return self._contexts[context_id]
+            
+            # Concurrent callers for the same id share one creation
+            return await self._create_once(('context', context_id),
+                                           lambda: self._new_stealth_context(context_id, proxy, block_resources))
+        except BaseException:
+            self.release_context(context_id)
+            raise
+    
+    def _checkout(self, context_id: str):
+        """Mark a context as in use."""
+        self._checkouts[context_id] = self._checkouts.get(context_id, 0) + 1
+    
+    def release_context(self, context_id: str):
+        """Drop one checkout taken by create_stealth_context()."""
+        count = self._checkouts.get(context_id, 0) - 1
+        if count > 0:
+            self._checkouts[context_id] = count
+        else:
+            self._checkouts.pop(context_id, None)
+    
+    async def _create_once(self, key: Any, factory) -> Any:
+        """Run factory() once per key at a time; concurrent callers await the same result."""
+        task = self._creating.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._creating[key] = task
+            task.add_done_callback(lambda _: self._creating.pop(key, None))
+        # Shielded so one cancelled caller doesn't abort the others' creation
+        return await asyncio.shield(task)
+    
+    async def _new_stealth_context(self, context_id: str, proxy: Optional[str],
+                                   block_resources: bool) -> BrowserContext:
+        """Create, configure and register a stealth context."""
+        # Make room for the new context
+        await self._evict_idle_contexts(self.max_contexts - 1)
         
         # Context configuration
         context_options = {
             'viewport': {'width': 1920, 'height': 1080},
             'user_agent': self._get_random_user_agent(),
-            'locale': random.choice(['en-US', 'en-GB', 'en-CA']),
-            'timezone_id': random.choice([
-                'America/New_York',
-                'America/Chicago', 
-                'America/Los_Angeles',
-                'America/Denver'
-            ]),
+            'locale': random.choice(_LOCALES),
+            'timezone_id': random.choice(_TIMEZONES),
             'permissions': ['geolocation', 'notifications'],
             'geolocation': self._get_random_geolocation(),
-            'color_scheme': random.choice(['light', 'dark', 'no-preference']),
+            'color_scheme': random.choice(_COLOR_SCHEMES),
             'extra_http_headers': self._get_stealth_headers(),
             'ignore_https_errors': True,
             'java_script_enabled': True
@@ -143,149 +367,41 @@ class BrowserManager:
         # Add stealth scripts to context
         await self._add_stealth_scripts(context)
         
+        # Skip downloading binary assets the scrapers never inspect
+        if block_resources:
+            await context.route('**/*', block_heavy_resources)
+        
         # Store context
         self._contexts[context_id] = context
         
         logger.info(f"Created stealth context: {context_id}")
         return context
     
+    async def _evict_idle_contexts(self, limit: int):
+        """Close least recently used contexts that aren't checked out until at most `limit` remain."""
+        for context_id in list(self._contexts):
+            if len(self._contexts) <= limit:
+                break
+            context = self._contexts.get(context_id)
+            if context is not None and not self._checkouts.get(context_id) and not context.pages:
+                logger.debug(f"Evicting idle context: {context_id}")
+                await self.close_context(context_id)
+    
     def _get_random_user_agent(self) -> str:
         """Get a random realistic user agent string."""
-        user_agents = [
-            # Chrome on Windows
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            # Chrome on Mac
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            # Firefox on Windows
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
-            # Edge on Windows
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0'
-        ]
-        return random.choice(user_agents)
+        return random.choice(_USER_AGENTS)
     
     def _get_random_geolocation(self) -> Dict[str, float]:
         """Get random US geolocation."""
-        locations = [
-            {'latitude': 40.7128, 'longitude': -74.0060},  # New York
-            {'latitude': 34.0522, 'longitude': -118.2437},  # Los Angeles
-            {'latitude': 41.8781, 'longitude': -87.6298},   # Chicago
-            {'latitude': 29.7604, 'longitude': -95.3698},   # Houston
-            {'latitude': 33.4484, 'longitude': -112.0740},  # Phoenix
-            {'latitude': 39.7392, 'longitude': -104.9903},  # Denver
-            {'latitude': 47.6062, 'longitude': -122.3321},  # Seattle
-            {'latitude': 25.7617, 'longitude': -80.1918},   # Miami
-        ]
-        return random.choice(locations)
+        return dict(random.choice(_GEOLOCATIONS))
     
     def _get_stealth_headers(self) -> Dict[str, str]:
         """Get stealth HTTP headers."""
-        return {
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0'
-        }
+        return dict(_STEALTH_HEADERS)
     
     async def _add_stealth_scripts(self, context: BrowserContext):
         """Add stealth JavaScript to bypass detection."""
-        stealth_js = """
-        // Override navigator.webdriver
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined
-        });
-        
-        // Override navigator.plugins to look realistic
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [1, 2, 3, 4, 5].map(i => ({
-                name: `Plugin ${i}`,
-                description: `Description ${i}`,
-                filename: `plugin${i}.dll`,
-                length: 1
-            }))
-        });
-        
-        // Override navigator.languages
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en']
-        });
-        
-        // Add chrome object
-        if (!window.chrome) {
-            window.chrome = {
-                runtime: {},
-                loadTimes: function() {},
-                csi: function() {},
-                app: {}
-            };
-        }
-        
-        // Override permissions
-        const originalQuery = window.navigator.permissions.query;
-        window.navigator.permissions.query = (parameters) => (
-            parameters.name === 'notifications' ?
-                Promise.resolve({ state: Notification.permission }) :
-                originalQuery(parameters)
-        );
-        
-        // Canvas fingerprinting protection
-        const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-        HTMLCanvasElement.prototype.toDataURL = function(type) {
-            if (type === 'image/png' && this.width === 280 && this.height === 60) {
-                // Return fake canvas fingerprint
-                return 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==';
-            }
-            return originalToDataURL.apply(this, arguments);
-        };
-        
-        // WebGL fingerprinting protection
-        const getParameter = WebGLRenderingContext.prototype.getParameter;
-        WebGLRenderingContext.prototype.getParameter = function(parameter) {
-            if (parameter === 37445) {
-                return 'Intel Inc.';
-            }
-            if (parameter === 37446) {
-                return 'Intel Iris OpenGL Engine';
-            }
-            return getParameter.apply(this, arguments);
-        };
-        
-        // Battery API protection
-        if (navigator.getBattery) {
-            navigator.getBattery = () => Promise.resolve({
-                charging: true,
-                chargingTime: 0,
-                dischargingTime: Infinity,
-                level: 1
-            });
-        }
-        
-        // Hardware concurrency randomization
-        Object.defineProperty(navigator, 'hardwareConcurrency', {
-            get: () => 4 + Math.floor(Math.random() * 4)
-        });
-        
-        // Device memory
-        Object.defineProperty(navigator, 'deviceMemory', {
-            get: () => 8
-        });
-        
-        // Max touch points
-        Object.defineProperty(navigator, 'maxTouchPoints', {
-            get: () => 0
-        });
-        """
-        
-        await context.add_init_script(stealth_js)
+        await context.add_init_script(_STEALTH_JS)
         logger.debug("Stealth scripts injected into context")
     
     async def get_page(self, context_id: str = 'default', 
@@ -300,22 +416,34 @@ class BrowserManager:
         Returns:
             Page instance
         """
-        # Ensure context exists
-        if context_id not in self._contexts:
-            await self.create_stealth_context(context_id)
-        
-        context = self._contexts[context_id]
+        # Get or create the context (and mark it recently used); our checkout
+        # covers the new_page() await, after which the page holds its own
+        context = await self.create_stealth_context(context_id)
         
-        # Create or get page
-        if page_id and page_id in self._pages:
-            page = self._pages[page_id]
-            if not page.is_closed():
-                logger.debug(f"Reusing existing page: {page_id}")
-                return page
-        
-        # Create new page
+        try:
+            # Create or get page
+            if page_id:
+                page = self._pages.get(page_id)
+                if page is not None and not page.is_closed():
+                    logger.debug(f"Reusing existing page: {page_id}")
+                    return page
+                # Concurrent callers for the same page id share one page
+                return await self._create_once(('page', page_id),
+                                               lambda: self._new_page(context, context_id, page_id))
+            
+            return await self._new_page(context, context_id)
+        finally:
+            self.release_context(context_id)
+    
+    async def _new_page(self, context: BrowserContext, context_id: str,
+                        page_id: Optional[str] = None) -> Page:
+        """Open a page in the context, registering it under page_id if given."""
         page = await context.new_page()
         
+        # Each open page keeps its context checked out until it closes
+        self._checkout(context_id)
+        page.once('close', lambda _: self.release_context(context_id))
+        
         # Store page if ID provided
         if page_id:
             self._pages[page_id] = page
@@ -325,41 +453,39 @@ class BrowserManager:
     
     async def close_page(self, page_id: str):
         """Close a specific page."""
-        if page_id in self._pages:
-            page = self._pages[page_id]
+        page = self._pages.pop(page_id, None)
+        if page is not None:
             if not page.is_closed():
                 await page.close()
-            del self._pages[page_id]
             logger.debug(f"Closed page: {page_id}")
     
     async def close_context(self, context_id: str):
         """Close a specific context and all its pages."""
         if context_id in self._contexts:
-            context = self._contexts[context_id]
+            # Unregister before awaiting so no caller is handed a closing context
+            context = self._contexts.pop(context_id)
             await context.close()
-            del self._contexts[context_id]
             
             # Remove pages associated with this context
-            pages_to_remove = []
-            for page_id, page in self._pages.items():
-                if page.context == context:
-                    pages_to_remove.append(page_id)
-            
+            pages_to_remove = [page_id for page_id, page in self._pages.items()
+                               if page.context == context]
             for page_id in pages_to_remove:
-                del self._pages[page_id]
+                self._pages.pop(page_id, None)
             
             logger.info(f"Closed context: {context_id}")
     
     async def cleanup(self):
         """Clean up all resources."""
         try:
-            # Close all pages
-            for page_id in list(self._pages.keys()):
-                await self.close_page(page_id)
+            # Let an in-flight warmup finish so its browser gets closed too
+            if self._init_task is not None and not self._init_task.done():
+                await asyncio.gather(self._init_task, return_exceptions=True)
             
-            # Close all contexts
-            for context_id in list(self._contexts.keys()):
-                await self.close_context(context_id)
+            # Close all pages, then all contexts, each batch concurrently
+            await asyncio.gather(*(self.close_page(page_id) for page_id in list(self._pages)),
+                                 return_exceptions=True)
+            await asyncio.gather(*(self.close_context(context_id) for context_id in list(self._contexts)),
+                                 return_exceptions=True)
             
             # Close browser
             if self._browser:
@@ -371,6 +497,13 @@ class BrowserManager:
                 await self._playwright.stop()
                 self._playwright = None
             
+            # Loop-bound helpers are rebuilt on next use, so a later event
+            # loop (e.g. another asyncio.run) starts clean
+            self._lock = None
+            self._init_task = None
+            self._creating.clear()
+            self._checkouts.clear()
+            
             logger.info("Browser manager cleaned up successfully")
             
         except Exception as e:
@@ -394,6 +527,8 @@ class BrowserManager:
                 await self.close_page(page_id)
             elif not page.is_closed():
                 await page.close()
+            # Trim contexts left idle after a burst of concurrent scrapes
+            await self._evict_idle_contexts(self.max_contexts)
 
 
 class HumanBehaviorSimulator:
@@ -427,16 +562,27 @@ class HumanBehaviorSimulator:
         # Calculate delay between keystrokes
         delay_ms = 60000 / chars_per_minute
         
-        for char in text:
-            await element.type(char, delay=random.uniform(delay_ms * 0.5, delay_ms * 1.5))
+        # Characters between pauses go out as one type() call (one round-trip
+        # per run instead of per keystroke), each run at its own jittered speed
+        run_start = 0
+        last = len(text) - 1
+        for i, char in enumerate(text):
+            pause = 0.0
             
             # Occasional longer pauses (thinking)
             if random.random() < 0.05:
-                await asyncio.sleep(random.uniform(0.5, 1.5))
+                pause += random.uniform(0.5, 1.5)
             
             # Natural pauses after punctuation
             if char in '.,!?;:':
-                await asyncio.sleep(random.uniform(0.2, 0.5))
+                pause += random.uniform(0.2, 0.5)
+            
+            if pause or i == last:
+                await element.type(text[run_start:i + 1],
+                                   delay=random.uniform(delay_ms * 0.5, delay_ms * 1.5))
+                run_start = i + 1
+                if pause:
+                    await asyncio.sleep(pause)
     
     @staticmethod
     async def human_click(page: Page, selector: str):
@@ -515,10 +661,48 @@ class HumanBehaviorSimulator:
             await HumanBehaviorSimulator.random_delay(0.1, 0.5)
 
 
+# Interactive elements checked for honeypots
+_HONEYPOT_SELECTOR = 'a, input, button, textarea, select'
+
+# Indexes (in querySelectorAll order) of hidden, off-screen or trap-named
+# elements. Zero-size and visibility:hidden also cover Playwright's is_visible()
+_HONEYPOT_JS = """
+(selector) => {
+    const suspicious = ['honeypot', 'trap', 'hidden', 'invisible'];
+    const indexes = [];
+    document.querySelectorAll(selector).forEach((element, i) => {
+        const style = window.getComputedStyle(element);
+        const rect = element.getBoundingClientRect();
+        
+        // Check for hidden elements
+        const hidden = style.display === 'none' ||
+            style.visibility === 'hidden' ||
+            parseFloat(style.opacity) === 0 ||
+            rect.width === 0 ||
+            rect.height === 0;
+        
+        // Check for off-screen elements
+        const offScreen = rect.left < -9999 || rect.top < -9999;
+        
+        // Check for elements with suspicious classes/ids
+        const classAndId = (element.className + ' ' + element.id).toLowerCase();
+        
+        if (hidden || offScreen || suspicious.some(term => classAndId.includes(term))) {
+            indexes.push(i);
+        }
+    });
+    return indexes;
+}
+"""
+
+
 async def detect_honeypots(page: Page) -> List[Any]:
     """
     Detect and return honeypot elements on the page.
     
+    All elements are checked in one in-page evaluate rather than two
+    round-trips per element; handles are only fetched when some are found.
+    
     Args:
         page: Page to check
         
@@ -527,47 +711,13 @@ async def detect_honeypots(page: Page) -> List[Any]:
     """
     honeypots = []
     
-    # Find all interactive elements
-    elements = await page.query_selector_all('a, input, button, textarea, select')
-    
-    for element in elements:
-        try:
-            # Check if element is visible
-            is_visible = await element.is_visible()
-            
-            # Check computed styles
-            is_honeypot = await element.evaluate("""
-                (element) => {
-                    const style = window.getComputedStyle(element);
-                    const rect = element.getBoundingClientRect();
-                    
-                    // Check for hidden elements
-                    if (style.display === 'none' || 
-                        style.visibility === 'hidden' ||
-                        parseFloat(style.opacity) === 0 ||
-                        rect.width === 0 || 
-                        rect.height === 0) {
-                        return true;
-                    }
-                    
-                    // Check for off-screen elements
-                    if (rect.left < -9999 || rect.top < -9999) {
-                        return true;
-                    }
-                    
-                    // Check for elements with suspicious classes/ids
-                    const suspicious = ['honeypot', 'trap', 'hidden', 'invisible'];
-                    const classAndId = (element.className + ' ' + element.id).toLowerCase();
-                    
-                    return suspicious.some(term => classAndId.includes(term));
-                }
-            """)
-            
-            if is_honeypot or not is_visible:
-                honeypots.append(element)
-                
-        except Exception as e:
-            logger.debug(f"Error checking element for honeypot: {e}")
+    try:
+        indexes = await page.evaluate(_HONEYPOT_JS, _HONEYPOT_SELECTOR)
+        if indexes:
+            elements = await page.query_selector_all(_HONEYPOT_SELECTOR)
+            honeypots = [elements[i] for i in indexes if i < len(elements)]
+    except Exception as e:
+        logger.debug(f"Error checking elements for honeypots: {e}")
     
     if honeypots:
         logger.info(f"Detected {len(honeypots)} honeypot elements")
@@ -575,5 +725,21 @@ async def detect_honeypots(page: Page) -> List[Any]:
     return honeypots
 
 
+# Resource types text extraction never needs; aborting them cuts page weight
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+
+async def block_heavy_resources(route) -> None:
+    """
+    Route handler that aborts image/media/font requests and lets the rest through.
+    
+    Usage: await context.route('**/*', block_heavy_resources)
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 # Singleton instance
 browser_manager = BrowserManager()
\ No newline at end of file
@@ -1,13 +1,12 @@
 """
 Enhanced Windows-compatible Playwright wrapper with better error handling.
-Runs Playwright in subprocess to avoid Windows event loop conflicts.
+Runs Playwright in a long-lived worker subprocess to avoid Windows event loop conflicts.
 """
 
 import asyncio
+import itertools
 import sys
 import json
-import subprocess
-import os
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import logging
@@ -15,167 +14,113 @@ import traceback
 
 logger = logging.getLogger(__name__)
 
+# Stream reader line limit; full gather results are far larger than the 64KB default
+_MAX_REPLY_BYTES = 64 * 1024 * 1024
 
-class PlaywrightSubprocessWrapperV2:
+
+class _PlaywrightWorker:
     """
-    Enhanced subprocess wrapper with better error handling and method coverage.
+    One long-lived `auto_enrich.playwright_worker` process shared by every wrapper.
+    
+    Python, Playwright and Chromium start once instead of once per call.
+    Requests are JSON lines tagged with an id; a background reader resolves
+    each caller's future as its reply arrives, so concurrent calls share the pipe.
     """
     
-    @staticmethod
-    def _create_subprocess_script(method_name: str, **kwargs) -> str:
-        """
-        Create a generic subprocess script for any method.
-        
-        Args:
-            method_name: Name of the method to call
-            **kwargs: Arguments to pass to the method
-            
-        Returns:
-            Python script as string
-        """
-        # Escape strings properly
-        escaped_kwargs = {}
-        for key, value in kwargs.items():
-            if isinstance(value, str):
-                escaped_kwargs[key] = value.replace('"', '\\"')
-            elif value is None:
-                escaped_kwargs[key] = None
-            else:
-                escaped_kwargs[key] = json.dumps(value)
-        
-        # Add the project root to Python path
-        project_root = Path(__file__).parent.parent.absolute()
-        
-        script = f"""
-import sys
-import os
-import json
-import asyncio
-import traceback
-from datetime import datetime
-
-# Add project root to path
-sys.path.insert(0, r'{project_root}')
-os.chdir(r'{project_root}')
-
-# Set Windows event loop
-if sys.platform == 'win32':
-    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-
-# Custom JSON encoder for non-serializable objects
-class EnhancedJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, set):
-            return list(obj)
-        if hasattr(obj, '__dict__'):
-            return str(obj)
-        return super().default(obj)
-
-async def run_method():
-    try:
-        from auto_enrich.web_scraper_playwright import PlaywrightWebGatherer
-        
-        async with PlaywrightWebGatherer() as gatherer:
-            method = getattr(gatherer, '{method_name}')
-            kwargs = {json.dumps(escaped_kwargs)}
-            
-            # Fix None values and escaped strings
-            for key, value in kwargs.items():
-                if value is None:
+    def __init__(self):
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count()
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def _ensure_started(self):
+        """Start the worker on first use, or again if it has exited."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._process is not None and self._process.returncode is None:
+                return
+            logger.info("Starting Playwright worker process")
+            self._process = await asyncio.create_subprocess_exec(
+                sys.executable, '-u', '-m', 'auto_enrich.playwright_worker',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                cwd=Path(__file__).parent.parent,
+                limit=_MAX_REPLY_BYTES
+            )
+            # Fresh pending map per process, so a dying worker only fails its own calls
+            self._pending = {}
+            self._reader = asyncio.create_task(self._read_replies(self._process, self._pending))
+    
+    async def _read_replies(self, process: asyncio.subprocess.Process,
+                            pending: Dict[int, asyncio.Future]):
+        """Resolve pending calls as replies arrive; fail them all if the worker dies."""
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    reply = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring malformed worker output: {line[:200]!r}")
                     continue
-                if isinstance(value, str) and value != 'null':
-                    kwargs[key] = value.replace('\\\\"', '"')
-                elif value == 'null':
-                    kwargs[key] = None
-            
-            result = await method(**kwargs)
-            return result
-    except Exception as e:
-        return {{
-            'error': str(e),
-            'traceback': traceback.format_exc(),
-            'method': '{method_name}'
-        }}
-
-try:
-    result = asyncio.run(run_method())
-    print(json.dumps(result, cls=EnhancedJSONEncoder))
-except Exception as e:
-    error_result = {{
-        'error': str(e),
-        'traceback': traceback.format_exc(),
-        'method': '{method_name}'
-    }}
-    print(json.dumps(error_result))
-"""
-        return script
+                future = pending.pop(reply.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(reply.get('result'))
+        except Exception as e:
+            logger.error(f"Playwright worker reader failed: {e}")
+        finally:
+            await process.wait()
+            if process.returncode:
+                logger.error(f"Playwright worker exited with code {process.returncode}")
+            for future in pending.values():
+                if not future.done():
+                    future.set_result({
+                        'error': 'Playwright worker exited',
+                        'returncode': process.returncode
+                    })
+            pending.clear()
     
-    @staticmethod
-    async def _run_subprocess(script: str, timeout: int = 120) -> Dict[str, Any]:
+    async def call(self, method_name: str, timeout: int, **kwargs) -> Dict[str, Any]:
         """
-        Run a Python script in a subprocess and return the result.
+        Run a PlaywrightWebGatherer method in the worker.
         
         Args:
-            script: Python script to run
+            method_name: Name of the method to call
             timeout: Timeout in seconds
+            **kwargs: Arguments to pass to the method (JSON-serializable)
             
         Returns:
             Result dictionary or error information
         """
         try:
-            # Write script to temp file for better debugging
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(script)
-                script_path = f.name
+            await self._ensure_started()
+            request_id = next(self._ids)
+            future = asyncio.get_running_loop().create_future()
+            pending = self._pending
+            pending[request_id] = future
+            
+            request = {'id': request_id, 'method': method_name, 'kwargs': kwargs}
+            self._process.stdin.write(json.dumps(request).encode('utf-8') + b'\n')
+            await self._process.stdin.drain()
             
             try:
-                result = await asyncio.create_subprocess_exec(
-                    sys.executable, script_path,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=Path(__file__).parent.parent
-                )
-                
-                try:
-                    stdout, stderr = await asyncio.wait_for(
-                        result.communicate(),
-                        timeout=timeout
-                    )
-                except asyncio.TimeoutError:
-                    result.kill()
-                    await result.wait()
-                    logger.error(f"Subprocess timed out after {timeout} seconds")
-                    return {
-                        'error': f'Subprocess timed out after {timeout} seconds',
-                        'timeout': True
-                    }
-                
-                if result.returncode != 0:
-                    error_msg = stderr.decode('utf-8', errors='ignore')
-                    logger.error(f"Subprocess failed: {error_msg}")
-                    return {
-                        'error': 'Subprocess failed',
-                        'stderr': error_msg,
-                        'returncode': result.returncode
-                    }
-                
-                # Parse JSON output
-                output = stdout.decode('utf-8', errors='ignore').strip()
-                if not output:
-                    return {'error': 'No output from subprocess'}
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError:
+                pending.pop(request_id, None)
+                self._cancel(request_id)
+                logger.error(f"Worker call {method_name} timed out after {timeout} seconds")
+                return {
+                    'error': f'Subprocess timed out after {timeout} seconds',
+                    'timeout': True
+                }
+            except asyncio.CancelledError:
+                pending.pop(request_id, None)
+                self._cancel(request_id)
+                raise
                 
-                return json.loads(output)
-                
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(script_path)
-                except:
-                    pass
-                    
         except Exception as e:
             logger.error(f"Subprocess execution error: {e}")
             return {
@@ -183,14 +128,62 @@ except Exception as e:
                 'traceback': traceback.format_exc()
             }
     
+    def _cancel(self, request_id: int):
+        """Tell the worker to stop an abandoned call (best effort, no reply expected)."""
+        process = self._process
+        if process is None or process.returncode is not None or process.stdin.is_closing():
+            return
+        try:
+            process.stdin.write(json.dumps({'id': request_id, 'cancel': True}).encode('utf-8') + b'\n')
+        except Exception as e:
+            logger.debug(f"Could not cancel worker call {request_id}: {e}")
+    
+    async def aclose(self):
+        """Close the worker's stdin so it finishes in-flight work and exits."""
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=30)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        if self._reader:
+            await self._reader
+
+
+# Shared worker (like browser_manager, one per process)
+_worker = _PlaywrightWorker()
+
+
+class PlaywrightSubprocessWrapperV2:
+    """
+    Enhanced subprocess wrapper with better error handling and method coverage.
+    
+    All instances send their calls to the shared long-lived worker process.
+    """
+    
+    @staticmethod
+    async def _run_method(method_name: str, timeout: int, **kwargs) -> Dict[str, Any]:
+        """Run a PlaywrightWebGatherer method in the worker process."""
+        result = await _worker.call(method_name, timeout, **kwargs)
+        if not isinstance(result, dict):
+            return {'error': f'Unexpected result type: {type(result).__name__}'}
+        return result
+    
+    @staticmethod
+    async def aclose():
+        """Shut down the shared worker process (application shutdown)."""
+        await _worker.aclose()
+    
     async def search_web(self, query: str, max_results: int = 10) -> List[Dict]:
         """Run web search in subprocess."""
-        script = self._create_subprocess_script(
-            'search',
+        result = await self._run_method(
+            'search', 60,
             query=query,
             max_results=max_results
         )
-        result = await self._run_subprocess(script, timeout=60)
         
         if 'error' in result:
             logger.error(f"Search failed: {result.get('error')}")
@@ -200,11 +193,7 @@ except Exception as e:
     
     async def scrape_website(self, url: str) -> Dict[str, Any]:
         """Scrape a website in subprocess."""
-        script = self._create_subprocess_script(
-            '_scrape_website',
-            url=url
-        )
-        result = await self._run_subprocess(script, timeout=90)
+        result = await self._run_method('_scrape_website', 90, url=url)
         
         if 'error' in result:
             logger.error(f"Scrape failed for {url}: {result.get('error')}")
@@ -216,16 +205,14 @@ except Exception as e:
                              additional_data: Optional[Dict] = None,
                              campaign_context: Optional[Dict] = None) -> Dict[str, Any]:
         """Full web data gathering in subprocess."""
-        script = self._create_subprocess_script(
-            'search_and_gather',
+        result = await self._run_method(
+            'search_and_gather', 180,  # 3 minutes
             company_name=company_name,
             location=location,
             additional_data=additional_data or {},
             campaign_context=campaign_context or {}
         )
         
-        result = await self._run_subprocess(script, timeout=180)  # 3 minutes
-        
         if 'error' in result:
             logger.error(f"Gather failed for {company_name}: {result.get('error')}")
             if 'traceback' in result:
@@ -0,0 +1,121 @@
+"""
+Long-lived Playwright worker process used by playwright_subprocess_wrapper_v2.
+
+Started once with `python -m auto_enrich.playwright_worker`; keeps a single
+PlaywrightWebGatherer (and so a single browser) open and serves requests
+over stdio as one JSON object per line:
+
+    request:  {"id": 1, "method": "search_and_gather", "kwargs": {...}}
+    reply:    {"id": 1, "result": {...}}
+    cancel:   {"id": 1, "cancel": true}
+
+Requests are handled concurrently, so replies may arrive out of order.
+A cancelled request (its caller timed out) is stopped and gets no reply.
+The worker exits when its stdin is closed.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+# Make the project importable regardless of how the worker was launched
+_PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+# Set Windows event loop
+if sys.platform == 'win32':
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+
+class EnhancedJSONEncoder(json.JSONEncoder):
+    """JSON encoder for the non-serializable objects gatherer results can contain."""
+
+    def default(self, obj):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if isinstance(obj, set):
+            return list(obj)
+        if hasattr(obj, '__dict__'):
+            return str(obj)
+        return super().default(obj)
+
+
+# Protocol stream; set up by _claim_stdout() when run as the worker
+_replies = None
+
+
+def _claim_stdout() -> None:
+    """
+    Keep the original stdout for replies only. Anything else the scraping
+    code prints is redirected to stderr so it can't corrupt the protocol stream.
+    """
+    global _replies
+    _replies = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+
+def _send(message: dict) -> None:
+    """Write one reply line (called from the event loop thread only)."""
+    _replies.write(json.dumps(message, cls=EnhancedJSONEncoder) + '\n')
+    _replies.flush()
+
+
+async def _handle(gatherer, request: dict) -> None:
+    """Run one gatherer method and reply with its result or the error."""
+    method_name = request.get('method', '')
+    try:
+        method = getattr(gatherer, method_name)
+        result = await method(**request.get('kwargs', {}))
+    except Exception as e:
+        result = {
+            'error': str(e),
+            'traceback': traceback.format_exc(),
+            'method': method_name
+        }
+    _send({'id': request.get('id'), 'result': result})
+
+
+async def main() -> None:
+    """Serve requests until stdin closes, then finish in-flight work and exit."""
+    from auto_enrich.web_scraper_playwright import PlaywrightWebGatherer
+    from auto_enrich.playwright_browser_manager import browser_manager
+
+    tasks: dict = {}
+    try:
+        async with PlaywrightWebGatherer() as gatherer:
+            while True:
+                # Blocking readline in a thread works with every event loop type
+                line = await asyncio.to_thread(sys.stdin.readline)
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                request_id = request.get('id')
+                if request.get('cancel'):
+                    # Stop abandoned work so it doesn't keep holding browser pages
+                    task = tasks.get(request_id)
+                    if task is not None:
+                        task.cancel()
+                    continue
+                task = asyncio.create_task(_handle(gatherer, request))
+                tasks[request_id] = task
+                task.add_done_callback(lambda _, request_id=request_id: tasks.pop(request_id, None))
+
+            if tasks:
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+    finally:
+        # The gatherer leaves the shared browser open; this process owns it
+        await browser_manager.cleanup()
+
+
+if __name__ == '__main__':
+    _claim_stdout()
+    asyncio.run(main())
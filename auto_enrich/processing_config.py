@@ -24,6 +24,7 @@ class ProcessingStep:
     optional_inputs: List[str] = field(default_factory=list)
     estimated_time_seconds: int = 10
     api_cost_estimate: float = 0.0
+    critical: bool = False  # If the step fails hard, skip the remaining steps for the record
 
 
 class ProcessingConfiguration:
@@ -364,7 +365,8 @@ class ProcessingConfiguration:
                     'description': step.description,
                     'category': step.category,
                     'estimated_time_seconds': step.estimated_time_seconds,
-                    'api_cost_estimate': step.api_cost_estimate
+                    'api_cost_estimate': step.api_cost_estimate,
+                    'critical': step.critical
                 }
                 for step_id, step in self.steps.items()
             },
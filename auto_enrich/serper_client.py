@@ -7,11 +7,16 @@ import os
 import asyncio
 import aiohttp
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import quote_plus
 
+from .http_session import create_pooled_session
+
 logger = logging.getLogger(__name__)
 
+# Serper accepts at most 100 queries per batch POST
+SERPER_BATCH_SIZE = 100
+
 
 class SerperClient:
     """
@@ -25,12 +30,14 @@ class SerperClient:
     - Location-based search
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize Serper client.
         
         Args:
             api_key: Serper API key (or set SERPER_API_KEY env variable)
+            session: Shared aiohttp session to reuse (created lazily if omitted)
         """
         self.api_key = api_key or os.environ.get('SERPER_API_KEY')
         if not self.api_key:
@@ -41,6 +48,23 @@ class SerperClient:
             'X-API-KEY': self.api_key,
             'Content-Type': 'application/json'
         }
+        
+        # One pooled session for all requests instead of a new one per call
+        self._session = session
+        self._owns_session = session is None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = create_pooled_session()
+            self._owns_session = True
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the session if this client created it."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def search(self, query: str, location: Optional[str] = None, 
                     num_results: int = 20, search_type: str = "search") -> Dict[str, Any]:
@@ -75,42 +99,111 @@ class SerperClient:
             payload['hl'] = 'en'  # Language
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(endpoint, json=payload, headers=self.headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info(f"Serper search successful for: {query}")
-                        return data
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Serper API error {response.status}: {error_text}")
-                        return {'error': f'API error {response.status}', 'organic': []}
+            session = await self._get_session()
+            async with session.post(endpoint, json=payload, headers=self.headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    logger.info(f"Serper search successful for: {query}")
+                    return data
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Serper API error {response.status}: {error_text}")
+                    return {'error': f'API error {response.status}', 'organic': []}
                         
         except Exception as e:
             logger.error(f"Serper request failed: {e}")
             return {'error': str(e), 'organic': []}
     
-    async def search_business(self, company_name: str, location: str = "") -> List[Dict[str, Any]]:
+    async def search_batch(self, payloads: List[Dict[str, Any]],
+                           search_type: str = "search") -> List[Dict[str, Any]]:
         """
-        Search for a business with location context.
+        Perform many searches with Serper's batch endpoint (JSON array body).
         
         Args:
-            company_name: Name of the business
-            location: Business location
+            payloads: Search payloads, each shaped like the single-search payload
+            search_type: Type of search (search, places, news, etc.)
             
         Returns:
-            List of search results formatted for our system
+            One result dictionary per payload, in the same order
         """
+        if not self.api_key:
+            logger.error("No API key configured for Serper")
+            return [{'error': 'No API key configured', 'organic': []} for _ in payloads]
+        
+        endpoint = f"{self.base_url}/{search_type}"
+        results = []
+        
+        for start in range(0, len(payloads), SERPER_BATCH_SIZE):
+            chunk = payloads[start:start + SERPER_BATCH_SIZE]
+            try:
+                session = await self._get_session()
+                async with session.post(endpoint, json=chunk, headers=self.headers) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        if isinstance(data, list) and len(data) == len(chunk):
+                            logger.info(f"Serper batch search successful for {len(chunk)} queries")
+                            results.extend(data)
+                        else:
+                            logger.error(f"Serper batch returned unexpected payload for {len(chunk)} queries")
+                            results.extend({'error': 'Unexpected batch response', 'organic': []} for _ in chunk)
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"Serper batch API error {response.status}: {error_text}")
+                        results.extend({'error': f'API error {response.status}', 'organic': []} for _ in chunk)
+                        
+            except Exception as e:
+                logger.error(f"Serper batch request failed: {e}")
+                results.extend({'error': str(e), 'organic': []} for _ in chunk)
+        
+        return results
+    
+    def _business_payload(self, company_name: str, location: str = "") -> Dict[str, Any]:
+        """Build the search payload used for business searches."""
         # Construct optimized business search query
         if location:
             query = f"{company_name} {location}"
         else:
             query = company_name
         
-        # Perform search - request more results for better coverage
-        results = await self.search(query, location=location, num_results=25)
+        # Request more results for better coverage
+        payload = {'q': query, 'num': 25}
+        if location:
+            payload['location'] = location
+            payload['gl'] = 'us'  # Country code
+            payload['hl'] = 'en'  # Language
+        return payload
+    
+    async def search_business(self, company_name: str, location: str = "") -> List[Dict[str, Any]]:
+        """
+        Search for a business with location context.
+        
+        Args:
+            company_name: Name of the business
+            location: Business location
+            
+        Returns:
+            List of search results formatted for our system
+        """
+        payload = self._business_payload(company_name, location)
+        results = await self.search(payload['q'], location=location, num_results=payload['num'])
+        return self._format_business_results(results)
+    
+    async def search_business_batch(self, companies: List[Tuple[str, str]]) -> List[List[Dict[str, Any]]]:
+        """
+        Search for many businesses in as few HTTP round-trips as possible.
         
-        # Format results for our system
+        Args:
+            companies: (company_name, location) pairs
+            
+        Returns:
+            Formatted search results for each company, in input order
+        """
+        payloads = [self._business_payload(name, location) for name, location in companies]
+        batch_results = await self.search_batch(payloads)
+        return [self._format_business_results(results) for results in batch_results]
+    
+    def _format_business_results(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Format raw Serper search results for our system."""
         formatted_results = []
         
         # Check for local/places results first (Google My Business)
@@ -204,39 +297,39 @@ class SerperClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(endpoint, json=payload, headers=self.headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
+            session = await self._get_session()
+            async with session.post(endpoint, json=payload, headers=self.headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    if data.get('places'):
+                        # Return the first (best) match
+                        place = data['places'][0]
+                        logger.info(f"Serper Maps found: {place.get('title')} - {place.get('website')}")
                         
-                        if data.get('places'):
-                            # Return the first (best) match
-                            place = data['places'][0]
-                            logger.info(f"Serper Maps found: {place.get('title')} - {place.get('website')}")
-                            
-                            return {
-                                'title': place.get('title'),
-                                'address': place.get('address'),
-                                'website': place.get('website'),
-                                'phone': place.get('phoneNumber'),
-                                'rating': place.get('rating'),
-                                'rating_count': place.get('ratingCount'),
-                                'type': place.get('type'),
-                                'types': place.get('types', []),
-                                'hours': place.get('openingHours', {}),
-                                'latitude': place.get('latitude'),
-                                'longitude': place.get('longitude'),
-                                'place_id': place.get('placeId'),
-                                'cid': place.get('cid')
-                            }
-                        else:
-                            logger.warning(f"No Maps results for: {query}")
-                            return None
+                        return {
+                            'title': place.get('title'),
+                            'address': place.get('address'),
+                            'website': place.get('website'),
+                            'phone': place.get('phoneNumber'),
+                            'rating': place.get('rating'),
+                            'rating_count': place.get('ratingCount'),
+                            'type': place.get('type'),
+                            'types': place.get('types', []),
+                            'hours': place.get('openingHours', {}),
+                            'latitude': place.get('latitude'),
+                            'longitude': place.get('longitude'),
+                            'place_id': place.get('placeId'),
+                            'cid': place.get('cid')
+                        }
                     else:
-                        error_text = await response.text()
-                        logger.error(f"Serper Maps API error {response.status}: {error_text}")
+                        logger.warning(f"No Maps results for: {query}")
                         return None
-                        
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Serper Maps API error {response.status}: {error_text}")
+                    return None
+                    
         except Exception as e:
             logger.error(f"Serper Maps request failed: {e}")
             return None
@@ -252,6 +345,10 @@ class SerperSearchProvider:
         """Initialize with API key."""
         self.client = SerperClient(api_key)
     
+    async def aclose(self) -> None:
+        """Close the underlying client's session."""
+        await self.client.aclose()
+    
     async def search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """
         Generic search method compatible with existing code.
@@ -297,19 +394,22 @@ async def search_with_serper(query: str, location: Optional[str] = None,
     """
     client = SerperClient()
     
-    # If it looks like a business search, use business search
-    if location:
-        results = await client.search_business(query, location)
-    else:
-        results_data = await client.search(query, num_results=max_results)
-        results = []
-        for r in results_data.get('organic', []):
-            results.append({
-                'title': r.get('title', ''),
-                'url': r.get('link', ''),
-                'snippet': r.get('snippet', ''),
-                'source': 'serper'
-            })
+    try:
+        # If it looks like a business search, use business search
+        if location:
+            results = await client.search_business(query, location)
+        else:
+            results_data = await client.search(query, num_results=max_results)
+            results = []
+            for r in results_data.get('organic', []):
+                results.append({
+                    'title': r.get('title', ''),
+                    'url': r.get('link', ''),
+                    'snippet': r.get('snippet', ''),
+                    'source': 'serper'
+                })
+    finally:
+        await client.aclose()
     
     return results[:max_results]
 
@@ -332,6 +432,7 @@ async def test_serper():
     if business_results:
         print(f"First result: {business_results[0].get('title')} - {business_results[0].get('url')}")
     
+    await client.aclose()
     return len(results.get('organic', [])) > 0
 
 
@@ -21,9 +21,15 @@ class SocialMediaScraper:
     Discovers and scrapes social media profiles for businesses.
     """
     
-    def __init__(self):
-        """Initialize the social media scraper."""
+    def __init__(self, parallel_limit: int = 3):
+        """
+        Initialize the social media scraper.
+        
+        Args:
+            parallel_limit: Maximum number of platforms searched concurrently
+        """
         self.content_extractor = EnhancedContentExtractor()
+        self.parallel_limit = parallel_limit
         
         # Social media platforms to search for
         self.platforms = {
@@ -89,6 +95,10 @@ class SocialMediaScraper:
             }
         }
     
+    async def aclose(self) -> None:
+        """Release the content extractor's browser and HTTP session."""
+        await self.content_extractor.aclose()
+    
     async def discover_social_profiles(self, company_name: str, location: str = "", 
                                      platforms: List[str] = None) -> Dict[str, Any]:
         """
@@ -104,6 +114,9 @@ class SocialMediaScraper:
         """
         if platforms is None:
             platforms = list(self.platforms.keys())
+        
+        # One timestamp for the whole discovery run, shared by every profile found
+        discovery_time = datetime.utcnow().isoformat()
             
         results = {
             'company_name': company_name,
@@ -114,44 +127,57 @@ class SocialMediaScraper:
                 'total_content_chars': 0,
                 'errors': []
             },
-            'discovery_time': datetime.utcnow().isoformat()
+            'discovery_time': discovery_time
         }
         
         logger.info(f"🔍 [SOCIAL] Starting social media discovery for {company_name}")
         logger.info(f"🎯 [SOCIAL] Searching platforms: {', '.join(platforms)}")
         
+        known_platforms = []
         for platform in platforms:
             if platform not in self.platforms:
                 logger.warning(f"⚠️ [SOCIAL] Unknown platform: {platform}")
                 continue
-                
-            try:
-                profile_info = await self._search_platform(
-                    platform, company_name, location
-                )
-                
-                if profile_info and profile_info.get('url'):
-                    results['profiles_found'][platform] = profile_info
-                    results['search_summary']['profiles_discovered'] += 1
-                    
-                    # Add content length to summary
-                    content_length = len(profile_info.get('content', ''))
-                    results['search_summary']['total_content_chars'] += content_length
-                    
-                    logger.info(f"✅ [SOCIAL] Found {platform}: {profile_info['url']} ({content_length} chars)")
-                else:
-                    logger.info(f"❌ [SOCIAL] No {platform} profile found")
-                    
-            except Exception as e:
-                error_msg = f"Error searching {platform}: {str(e)}"
+            known_platforms.append(platform)
+        
+        # Search platforms concurrently; the semaphore keeps at most
+        # parallel_limit searches in flight without waiting on batch stragglers
+        semaphore = asyncio.BoundedSemaphore(self.parallel_limit)
+        
+        async def search(platform: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._search_platform(platform, company_name, location, discovery_time)
+        
+        outcomes = await asyncio.gather(
+            *(search(platform) for platform in known_platforms),
+            return_exceptions=True
+        )
+        
+        for platform, profile_info in zip(known_platforms, outcomes):
+            if isinstance(profile_info, Exception):
+                error_msg = f"Error searching {platform}: {str(profile_info)}"
                 results['search_summary']['errors'].append(error_msg)
                 logger.error(f"❌ [SOCIAL] {error_msg}")
+                continue
+            
+            if profile_info and profile_info.get('url'):
+                results['profiles_found'][platform] = profile_info
+                results['search_summary']['profiles_discovered'] += 1
+                
+                # Add content length to summary
+                content_length = len(profile_info.get('content', ''))
+                results['search_summary']['total_content_chars'] += content_length
+                
+                logger.info(f"✅ [SOCIAL] Found {platform}: {profile_info['url']} ({content_length} chars)")
+            else:
+                logger.info(f"❌ [SOCIAL] No {platform} profile found")
         
         logger.info(f"📊 [SOCIAL] Discovery complete: {results['search_summary']['profiles_discovered']} profiles found")
         return results
     
     async def _search_platform(self, platform: str, company_name: str, 
-                             location: str = "") -> Optional[Dict[str, Any]]:
+                             location: str = "",
+                             scraped_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Search for a specific platform profile.
         
@@ -159,6 +185,7 @@ class SocialMediaScraper:
             platform: Platform name (facebook, instagram, etc.)
             company_name: Business name
             location: Business location
+            scraped_at: ISO timestamp to record (defaults to now)
             
         Returns:
             Profile information if found
@@ -205,7 +232,7 @@ class SocialMediaScraper:
                             'url': profile_url,
                             'content': profile_content,
                             'found_via_query': query,
-                            'scraped_at': datetime.utcnow().isoformat()
+                            'scraped_at': scraped_at or datetime.utcnow().isoformat()
                         }
                         
             except Exception as e:
@@ -258,21 +285,13 @@ class SocialMediaScraper:
             Extracted content as clean text
         """
         try:
-            # Use the enhanced content extractor with Playwright fallback
-            extracted_content = await self.content_extractor.extract_from_url(
-                profile_url,
-                additional_selectors=content_selectors,
-                timeout=30
-            )
+            # Use the enhanced content extractor with Playwright fallback;
+            # it always returns the same dict shape, with 'text' set on success
+            extracted_content = await self.content_extractor.extract(profile_url)
             
-            if extracted_content:
-                # Convert HTML to clean text
-                content = extracted_content.get('markdown_content', '')
-                if not content:
-                    content = extracted_content.get('text_content', '')
-                
+            if extracted_content['success']:
                 # Clean and truncate content for AI processing
-                content = self._clean_social_content(content)
+                content = self._clean_social_content(extracted_content['text'])
                 return content[:2000]  # Limit to 2000 chars per profile
             
         except Exception as e:
@@ -376,4 +395,7 @@ async def discover_social_media(company_name: str, location: str = "",
         Social media discovery results
     """
     scraper = SocialMediaScraper()
-    return await scraper.get_social_context_for_ai(company_name, location, platforms)
\ No newline at end of file
+    try:
+        return await scraper.get_social_context_for_ai(company_name, location, platforms)
+    finally:
+        await scraper.aclose()
\ No newline at end of file
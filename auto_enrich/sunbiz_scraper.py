@@ -5,13 +5,62 @@ officer/director information from the corporate record.
 """
 
 import asyncio
+import json
 import logging
+import os
 import re
+import sys
+import tempfile
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 from urllib.parse import urljoin
 
 logger = logging.getLogger(__name__)
 
+# Line classifiers for the person/officer detail blocks, compiled once
+_STATE_ZIP_RE = re.compile(r'\b[A-Z]{2}\s+\d{5}')
+# Street line (numbers + suffix, any case) or "ST 12345", tested in a single pass
+_ADDRESS_LINE_RE = re.compile(
+    r'(?i:\d+.*\b(?:AVE|ST|RD|BLVD|DR|LANE|CT|WAY|PKWY|PLAZA|CIRCLE|PLACE)\b)'
+    r'|\b[A-Z]{2}\s+\d{5}'
+)
+# Sunbiz punctuation variations dropped before comparing names:
+# commas before INC/LLC, periods (L.L.C. vs LLC) and apostrophes (BOB'S vs BOBS)
+_SUNBIZ_NAME_TABLE = str.maketrans('', '', ",.'")
+
+
+def _normalize_for_sunbiz(text: str) -> str:
+    """Uppercase, strip Sunbiz punctuation variations and collapse whitespace."""
+    return ' '.join(text.upper().translate(_SUNBIZ_NAME_TABLE).split())
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory (LOCALAPPDATA on Windows, XDG_CACHE_HOME or ~/.cache elsewhere)."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'auto_enrich'
+
+
+# Cookies/localStorage from earlier runs, so Sunbiz's session and anti-bot
+# cookies carry over between searches and between processes. Kept in a
+# per-user directory, since the cookies are session credentials.
+_STORAGE_STATE_PATH = _user_cache_dir() / 'sunbiz_playwright_state.json'
+
+
+def _is_storage_state(state: Any) -> bool:
+    """Check the shape Playwright expects: {'cookies': [{...}], 'origins': [{...}]}."""
+    if not isinstance(state, dict):
+        return False
+    for key in ('cookies', 'origins'):
+        items = state.get(key, [])
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return False
+    return True
+
+_OFFICER_ADDRESS_HINTS = ('ave', 'st', 'rd', 'blvd', 'dr', 'lane', 'suite', 'ct', 'way', 'pkwy', 'plaza')
+
 
 class SunbizScraper:
     """
@@ -23,6 +72,108 @@ class SunbizScraper:
         """Initialize the Sunbiz scraper."""
         self.base_url = "https://search.sunbiz.org"
         self.search_url = f"{self.base_url}/Inquiry/CorporationSearch/ByName"
+        # Shared Chromium, launched on the first search and reused afterwards
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+        # Saved cookies are read with the first browser launch and written
+        # back by aclose(), i.e. once per scraper lifetime (one batch)
+        self._storage_state = None
+        self._storage_state_loaded = False
+        self._storage_state_dirty = False
+    
+    def _load_storage_state(self) -> Optional[Dict[str, Any]]:
+        """Load cookies saved by a previous run, if any."""
+        try:
+            # Ignore a file someone else planted in our cache directory
+            if hasattr(os, 'getuid') and _STORAGE_STATE_PATH.stat().st_uid != os.getuid():
+                return None
+            state = json.loads(_STORAGE_STATE_PATH.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return state if _is_storage_state(state) else None
+    
+    def _save_storage_state(self) -> None:
+        """Persist the latest cookies for the next run (atomic replace, owner-only file)."""
+        if not self._storage_state:
+            return
+        tmp_name = None
+        try:
+            _STORAGE_STATE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Unique temp file (created 0600) so concurrent processes don't collide
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=_STORAGE_STATE_PATH.parent,
+                                             prefix='.sunbiz_state_', suffix='.tmp',
+                                             delete=False) as f:
+                tmp_name = f.name
+                json.dump(self._storage_state, f)
+            os.replace(tmp_name, _STORAGE_STATE_PATH)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not save Sunbiz storage state: {e}")
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+    
+    async def _new_context(self, browser):
+        """Open a search context, falling back to a fresh one if the saved state is rejected."""
+        options = {
+            'user_agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            'viewport': {'width': 1920, 'height': 1080},
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+        }
+        if self._storage_state:
+            try:
+                return await browser.new_context(storage_state=self._storage_state, **options)
+            except Exception as e:
+                logger.warning(f"Saved Sunbiz session rejected, starting fresh: {e}")
+                self._storage_state = None
+        return await browser.new_context(**options)
+    
+    async def _ensure_browser(self):
+        """Get the shared browser, launching it on first use (or after a crash)."""
+        async with self._browser_lock:
+            if not self._storage_state_loaded:
+                self._storage_state = await asyncio.to_thread(self._load_storage_state)
+                self._storage_state_loaded = True
+            if self._browser is None or not self._browser.is_connected():
+                from playwright.async_api import async_playwright
+                
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                # Launch browser with more realistic settings
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        '--disable-blink-features=AutomationControlled',
+                        '--disable-dev-shm-usage',
+                        '--no-sandbox'
+                    ]
+                )
+            return self._browser
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Save cookies, close the shared browser and stop Playwright."""
+        if self._storage_state_dirty:
+            await asyncio.to_thread(self._save_storage_state)
+            self._storage_state_dirty = False
+        async with self._browser_lock:
+            if self._browser is not None:
+                try:
+                    await self._browser.close()
+                except Exception as e:
+                    logger.debug(f"Error closing Sunbiz browser: {e}")
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
         
     async def search_business(self, business_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -34,135 +185,122 @@ class SunbizScraper:
         Returns:
             Dictionary with corporate information including officers
         """
+        context = None
         try:
-            from playwright.async_api import async_playwright
+            # One browser serves every search; each search gets a fresh context
+            browser = await self._ensure_browser()
             
-            async with async_playwright() as p:
-                # Launch browser with more realistic settings
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox'
-                    ]
-                )
-                
-                # Create context with full user agent and viewport
-                context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    viewport={'width': 1920, 'height': 1080},
-                    locale='en-US',
-                    timezone_id='America/New_York'
-                )
-                
-                # Add anti-detection scripts
-                await context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                """)
-                
-                page = await context.new_page()
-                
-                # Navigate to search page with more natural timing
-                logger.info(f"Navigating to Sunbiz search for: {business_name}")
-                await page.goto(self.search_url, wait_until='domcontentloaded')
-                
-                # Small delay to appear more human
-                await page.wait_for_timeout(1000)
-                
-                # Click on the search field first (more human-like)
-                search_input = await page.wait_for_selector('input[name="SearchTerm"]', timeout=5000)
-                await search_input.click()
-                
-                # Small delay before typing
-                await page.wait_for_timeout(500)
-                
-                # Type the business name with realistic typing speed
-                await search_input.type(business_name, delay=50)
-                
-                # Small delay before submitting
-                await page.wait_for_timeout(500)
-                
-                # Submit by clicking the Search Now button instead of pressing Enter
-                search_button = await page.query_selector('input[type="submit"][value="Search Now"]')
-                if search_button:
-                    await search_button.click()
-                else:
-                    # Fallback to Enter key
-                    await page.press('input[name="SearchTerm"]', 'Enter')
-                
-                # Wait for navigation
-                await page.wait_for_load_state('networkidle', timeout=10000)
-                
-                # Look for result links directly (more reliable than table.SearchResults)
-                # Sunbiz puts results as links with 'SearchResultDetail' in the href
-                result_links = await page.query_selector_all('a[href*="SearchResultDetail"]')
-                
-                if not result_links:
-                    logger.warning(f"No results found for: {business_name}")
-                    await browser.close()
-                    return None
-                
-                logger.info(f"Found {len(result_links)} potential matches")
-                
-                # Find the best matching result
-                best_match_link = None
-                
-                for link in result_links:
-                    name_text = await link.inner_text()
-                    
-                    # Sunbiz may display names with slight punctuation differences
-                    name_text_clean = name_text.strip().upper()
-                    business_name_clean = business_name.strip().upper()
-                    
-                    # Limited normalization - only handle common Sunbiz punctuation variations:
-                    # 1. Remove commas (Sunbiz adds comma before INC, LLC, etc.)
-                    # 2. Remove periods (L.L.C. vs LLC, INC. vs INC)
-                    # 3. Remove apostrophes (BOB'S vs BOBS)
-                    # 4. Normalize multiple spaces to single space
-                    def normalize_for_sunbiz(text):
-                        return ' '.join(text.replace(',', '')
-                                          .replace('.', '')
-                                          .replace("'", '')
-                                          .split())
-                    
-                    name_text_normalized = normalize_for_sunbiz(name_text_clean)
-                    business_name_normalized = normalize_for_sunbiz(business_name_clean)
-                    
-                    # Check for match after minimal normalization
-                    if name_text_normalized == business_name_normalized:
-                        best_match_link = link
-                        logger.info(f"Found match: {name_text}")
-                        break
-                    
-                    # Check if this might be a truncated match
-                    # Sunbiz typically shows about 100 characters max in the results
-                    elif len(name_text_clean) >= 95 and business_name_normalized.startswith(name_text_normalized):
-                        # The displayed name might be truncated
-                        best_match_link = link
-                        logger.info(f"Found potential truncated match: {name_text}")
-                        break
+            # Create context with full user agent and viewport
+            context = await self._new_context(browser)
+            
+            # Skip images, media and fonts - only the record text is read
+            from .playwright_browser_manager import block_heavy_resources
+            await context.route('**/*', block_heavy_resources)
+            
+            # Add anti-detection scripts
+            await context.add_init_script("""
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+            """)
+            
+            page = await context.new_page()
+            
+            # Navigate to search page with more natural timing
+            logger.info(f"Navigating to Sunbiz search for: {business_name}")
+            await page.goto(self.search_url, wait_until='domcontentloaded')
+            
+            # Click on the search field first (more human-like); waiting for it
+            # to appear replaces a fixed post-navigation pause
+            search_input = await page.wait_for_selector('input[name="SearchTerm"]', timeout=5000)
+            await search_input.click()
+            
+            # Small delay before typing
+            await page.wait_for_timeout(500)
+            
+            # Type the business name with realistic typing speed
+            await search_input.type(business_name, delay=50)
+            
+            # Small delay before submitting
+            await page.wait_for_timeout(500)
+            
+            # Submit by clicking the Search Now button instead of pressing Enter
+            search_button = await page.query_selector('input[type="submit"][value="Search Now"]')
+            if search_button:
+                await search_button.click()
+            else:
+                # Fallback to Enter key
+                await page.press('input[name="SearchTerm"]', 'Enter')
+            
+            # Wait for navigation
+            await page.wait_for_load_state('networkidle', timeout=10000)
+            
+            # Look for result links directly (more reliable than table.SearchResults)
+            # Sunbiz puts results as links with 'SearchResultDetail' in the href
+            result_links = await page.query_selector_all('a[href*="SearchResultDetail"]')
+            
+            if not result_links:
+                logger.warning(f"No results found for: {business_name}")
+                return None
+            
+            logger.info(f"Found {len(result_links)} potential matches")
+            
+            # Find the best matching result
+            best_match_link = None
+            
+            # Sunbiz may display names with slight punctuation differences;
+            # the searched name only needs normalizing once
+            business_name_normalized = _normalize_for_sunbiz(business_name)
+            
+            for link in result_links:
+                name_text = await link.inner_text()
+                name_text_clean = name_text.strip()
+                name_text_normalized = _normalize_for_sunbiz(name_text_clean)
                 
-                if not best_match_link:
-                    logger.warning(f"No exact match found for: {business_name}")
-                    await browser.close()
-                    return None
+                # Check for match after minimal normalization
+                if name_text_normalized == business_name_normalized:
+                    best_match_link = link
+                    logger.info(f"Found match: {name_text}")
+                    break
                 
-                # Click on the matching result
-                await best_match_link.click()
+                # Check if this might be a truncated match
+                # Sunbiz typically shows about 100 characters max in the results
+                elif len(name_text_clean) >= 95 and business_name_normalized.startswith(name_text_normalized):
+                    # The displayed name might be truncated
+                    best_match_link = link
+                    logger.info(f"Found potential truncated match: {name_text}")
+                    break
+            
+            if not best_match_link:
+                logger.warning(f"No exact match found for: {business_name}")
+                return None
+            
+            # Click on the matching result and wait for the detail sections to render
+            # (networkidle can hang on analytics beacons long after the record is there)
+            await best_match_link.click()
+            try:
+                await page.wait_for_selector('.detailSection', timeout=10000)
+            except Exception:
                 await page.wait_for_load_state('networkidle')
-                
-                # Extract information from the detail page
-                result = await self._extract_corporate_info(page)
-                
-                await browser.close()
-                return result
-                
+            
+            # Extract information from the detail page
+            result = await self._extract_corporate_info(page)
+            
+            # Keep the session cookies for the next search
+            self._storage_state = await context.storage_state()
+            self._storage_state_dirty = True
+            
+            return result
+            
         except Exception as e:
             logger.error(f"Error scraping Sunbiz for {business_name}: {e}")
             return None
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
     
     async def _extract_corporate_info(self, page) -> Dict[str, Any]:
         """
@@ -284,12 +422,8 @@ class SunbizScraper:
                         
                         # Look for name line (comes after title, before address)
                         elif current_person and 'title' in current_person and 'full_name' not in current_person:
-                            # Skip if this looks like an address line with street suffix
-                            # More specific check - only skip if it has numbers AND street suffix
-                            if re.search(r'\d+.*\b(AVE|ST|RD|BLVD|DR|LANE|CT|WAY|PKWY|PLAZA|CIRCLE|PLACE)\b', line, re.IGNORECASE):
-                                continue
-                            # Skip if line contains state abbreviation and zip (address pattern)
-                            if re.search(r'\b[A-Z]{2}\s+\d{5}', line):
+                            # Skip address lines: numbers AND street suffix, or state abbreviation and zip
+                            if _ADDRESS_LINE_RE.search(line):
                                 continue
                             # Skip if line is just numbers (likely street number)
                             if line.replace(' ', '').isdigit():
@@ -354,10 +488,11 @@ class SunbizScraper:
                             if line == current_officer.get('title'):
                                 continue
                             # Skip if this looks like an address line
-                            if any(x in line.lower() for x in ['ave', 'st', 'rd', 'blvd', 'dr', 'lane', 'suite', 'ct', 'way', 'pkwy', 'plaza']):
+                            line_lower = line.lower()
+                            if any(x in line_lower for x in _OFFICER_ADDRESS_HINTS):
                                 continue
                             # Skip if line contains state abbreviation and zip
-                            if re.search(r'\b[A-Z]{2}\s+\d{5}', line):
+                            if _STATE_ZIP_RE.search(line):
                                 continue
                             # Skip if line is just numbers
                             if line.replace(' ', '').isdigit():
@@ -406,7 +541,10 @@ async def test_sunbiz_scraper():
     scraper = SunbizScraper()
     
     # Test with a known Florida business
-    result = await scraper.search_business("GATOR CITY MOTORS LLC")
+    try:
+        result = await scraper.search_business("GATOR CITY MOTORS LLC")
+    finally:
+        await scraper.aclose()
     
     if result:
         print("\n=== Sunbiz Scraper Test Results ===")
@@ -29,9 +29,14 @@ if USE_SERPER:
 elif USE_PLAYWRIGHT and sys.platform == 'win32':
     try:
         # Check if we're in a running event loop (FastAPI/uvicorn)
-        asyncio.get_running_loop()
-        # We're in an existing loop - use enhanced subprocess wrapper for Windows
-        logger.info("Windows detected with existing event loop - using enhanced Playwright subprocess wrapper")
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    
+    if running_loop is not None and not isinstance(running_loop, asyncio.ProactorEventLoop):
+        # A selector loop (e.g. uvicorn --reload) can't spawn Playwright's driver
+        # - use enhanced subprocess wrapper for Windows
+        logger.info("Windows detected with selector event loop - using enhanced Playwright subprocess wrapper")
         from .playwright_subprocess_wrapper_v2 import WindowsPlaywrightGatherer as WebDataGatherer
         from .playwright_subprocess_wrapper_v2 import PlaywrightSubprocessWrapperV2
         
@@ -39,8 +44,9 @@ elif USE_PLAYWRIGHT and sys.platform == 'win32':
             wrapper = PlaywrightSubprocessWrapperV2()
             return await wrapper.search_web(query, kwargs.get('max_results', 10))
             
-    except RuntimeError:
-        # No event loop - safe to use Playwright directly
+    else:
+        # No event loop yet, or a Proactor loop (the Windows default since
+        # Python 3.8) - safe to use Playwright directly
         try:
             from .web_scraper_playwright import PlaywrightWebGatherer as WebDataGatherer, search_web
             logger.info("Using Playwright implementation (direct mode)")
@@ -7,6 +7,7 @@ import asyncio
 import sys
 import logging
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlparse, quote_plus
 
@@ -33,6 +34,74 @@ MCP_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Domain/keyword classifiers compiled once: one C-level scan per domain instead
+# of a Python any() over substring lists for every search result.
+_DIRECTORY_RE = re.compile(
+    r'yelp\.|yellowpages\.|facebook\.|linkedin\.|twitter\.|instagram\.|'
+    r'bbb\.org|manta\.com|bizapedia\.|dnb\.com|zoominfo\.'
+)
+_SOCIAL_RE = re.compile(r'facebook\.|linkedin\.|instagram\.|twitter\.|x\.com')
+_REVIEW_RE = re.compile(r'yelp\.|google\.com/maps|trustpilot\.|bbb\.org')
+_NEWS_URL_RE = re.compile(r'news|press|article|blog|announcement', re.IGNORECASE)
+_PHONE_CLEAN_RE = re.compile(r'[^\d+()-.\s]')
+
+# Root domains that are never a business's own site or a useful source;
+# an O(1) set probe skips every classifier for them
+_IRRELEVANT_ROOTS = frozenset({
+    'pinterest.com', 'quora.com', 'reddit.com', 'archive.org',
+    'wikipedia.org', 'youtube.com', 'amazon.com', 'ebay.com'
+})
+
+# Root domains of common directories, probed before the _DIRECTORY_RE scan
+_DIRECTORY_ROOTS = frozenset({
+    'yelp.com', 'yellowpages.com', 'facebook.com', 'linkedin.com',
+    'twitter.com', 'instagram.com', 'bbb.org', 'manta.com',
+    'bizapedia.com', 'dnb.com', 'zoominfo.com'
+})
+
+
+# Source type for the common social/review roots, resolved with one dict probe
+# before falling back to the substring chain in _identify_source_type
+_SOURCE_TYPE_BY_ROOT = {
+    'facebook.com': 'facebook',
+    'linkedin.com': 'linkedin',
+    'instagram.com': 'instagram',
+    'twitter.com': 'twitter',
+    'x.com': 'twitter',
+    'yelp.com': 'yelp_reviews',
+    'bbb.org': 'bbb_profile',
+}
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Lower-cased host of a URL; cached since directory/social URLs recur across companies."""
+    return urlparse(url).netloc.lower()
+
+
+def _root_domain(domain: str) -> str:
+    """Last two labels of a host name, e.g. 'm.yelp.com' -> 'yelp.com'."""
+    return '.'.join(domain.split('.')[-2:])
+
+
+def _canonical_url_key(url: str, domain: str) -> tuple:
+    """Dedupe key ignoring www./m. hosts, query strings, fragments and trailing slashes."""
+    host = domain.removeprefix('www.').removeprefix('m.')
+    return host, urlparse(url).path.rstrip('/')
+
+
+# Legal-form words that say nothing about which domain belongs to the company
+_COMPANY_STOPWORDS = frozenset({
+    'inc.', 'llc.', 'corp', 'corp.', 'company', 'corporation', 'incorporated'
+})
+
+# Campaign focus flag -> classifier, in the order sources are selected
+_CAMPAIGN_CLASSIFIERS = (
+    ('social_focus', _SOCIAL_RE, False),
+    ('review_focus', _REVIEW_RE, False),
+    ('news_focus', _NEWS_URL_RE, True),
+)
+
 
 class PlaywrightWebGatherer:
     """
@@ -40,16 +109,20 @@ class PlaywrightWebGatherer:
     Single browser instance with anti-detection for reliable scraping.
     """
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, parallel_limit: int = 3):
         """
         Initialize Playwright web gatherer.
         
         Args:
             headless: MUST be True in production to prevent window spam
+            parallel_limit: Maximum number of pages scraped concurrently
         """
         self.headless = headless
+        self.parallel_limit = parallel_limit
         self.searcher = PlaywrightSearch(headless=headless)
         self.simulator = HumanBehaviorSimulator()
+        # Bounds every page scrape so N are always in flight, no batch stragglers
+        self._scrape_semaphore = asyncio.BoundedSemaphore(parallel_limit)
     
     async def __aenter__(self):
         """Async context manager entry - initialize resources."""
@@ -145,17 +218,23 @@ class PlaywrightWebGatherer:
         
         return gathered_data
     
-    async def _scrape_website(self, url: str) -> Dict[str, Any]:
+    async def _scrape_website(self, url: str, domain: Optional[str] = None) -> Dict[str, Any]:
         """
         Scrape website content using Playwright with anti-detection.
         Falls back to MCP if available for HTML to Markdown conversion.
         
         Args:
             url: Website URL to scrape
+            domain: Already-parsed domain of url, if the caller has it
             
         Returns:
             Website content and metadata
         """
+        async with self._scrape_semaphore:
+            return await self._scrape_website_unbounded(url, domain)
+    
+    async def _scrape_website_unbounded(self, url: str, domain: Optional[str] = None) -> Dict[str, Any]:
+        """Scrape a single page; callers go through _scrape_website."""
         context_id = f"scrape_{hash(url)}"
         
         try:
@@ -279,7 +358,7 @@ class PlaywrightWebGatherer:
                     cleaned_phones = []
                     for phone in content_data['contact']['phones']:
                         # Basic cleaning
-                        cleaned = re.sub(r'[^\d+()-.\s]', '', phone)
+                        cleaned = _PHONE_CLEAN_RE.sub('', phone)
                         if len(cleaned) >= 10:  # Valid phone length
                             cleaned_phones.append(cleaned)
                     content_data['contact']['phones'] = cleaned_phones[:3]
@@ -287,7 +366,7 @@ class PlaywrightWebGatherer:
                 # Add metadata
                 content_data['url'] = url
                 content_data['fetched_via'] = 'playwright'
-                content_data['domain'] = urlparse(url).netloc
+                content_data['domain'] = domain if domain is not None else urlparse(url).netloc
                 
                 return content_data
                 
@@ -321,30 +400,32 @@ class PlaywrightWebGatherer:
                 if not url.startswith('https://www.google.com'):
                     return url
         
-        # Priority 2: First result with company name in domain
-        company_words = [w.lower() for w in company_name.split() if len(w) > 3]
-        for result in search_results:
-            url = result.get('url', '')
-            domain = urlparse(url).netloc.lower()
-            if any(word in domain for word in company_words):
-                return url
+        # Parse each result's domain once for both domain-based priorities
+        urls = [result.get('url', '') for result in search_results]
+        domains = [_netloc(url) for url in urls]
         
-        # Priority 3: First non-directory result
-        directories = [
-            'yelp.', 'yellowpages.', 'facebook.', 'linkedin.',
-            'twitter.', 'instagram.', 'bbb.org', 'manta.com',
-            'bizapedia.', 'dnb.com', 'zoominfo.'
-        ]
+        # Priority 2: First result with company name in domain, matched with
+        # one compiled alternation per call instead of a per-word any() loop
+        company_words = {w for w in company_name.lower().split()
+                         if len(w) > 3 and w not in _COMPANY_STOPWORDS}
+        if company_words:
+            company_word_re = re.compile('|'.join(map(re.escape, company_words)))
+            for url, domain in zip(urls, domains):
+                if company_word_re.search(domain):
+                    return url
         
-        for result in search_results:
-            url = result.get('url', '')
-            domain = urlparse(url).netloc.lower()
-            if not any(dir_site in domain for dir_site in directories):
+        # Priority 3: First non-directory result
+        roots = [_root_domain(domain) for domain in domains]
+        for url, domain, root in zip(urls, domains, roots):
+            if root in _IRRELEVANT_ROOTS or root in _DIRECTORY_ROOTS:
+                continue
+            if not _DIRECTORY_RE.search(domain):
                 return url
         
         # Fallback: First result that's not Google
-        for result in search_results:
-            url = result.get('url', '')
+        for url, root in zip(urls, roots):
+            if root in _IRRELEVANT_ROOTS:
+                continue
             if url and not url.startswith('https://www.google.com'):
                 return url
         
@@ -363,37 +444,67 @@ class PlaywrightWebGatherer:
         """
         try:
             # Select relevant sources based on campaign
+            # Classify the top 7 results column-wise: URLs and domains are
+            # extracted once, then only the campaign's enabled classifiers run
+            top_results = search_results[:7]
+            urls = [result.get('url', '') for result in top_results]
+            domains = [_netloc(url) for url in urls]
+            
+            # (pattern, match against full URL instead of domain)
+            classifiers = [
+                (pattern, on_url)
+                for focus, pattern, on_url in _CAMPAIGN_CLASSIFIERS
+                if campaign_context.get(focus)
+            ]
+            
+            # Sources are kept as (result, domain) so the URL is parsed only once
             relevant_sources = []
+            for result, url, domain in zip(top_results, urls, domains):
+                if _root_domain(domain) in _IRRELEVANT_ROOTS:
+                    continue
+                for pattern, on_url in classifiers:
+                    if pattern.search(url if on_url else domain):
+                        relevant_sources.append((result, domain))
             
-            for result in search_results[:7]:  # Process top 7 results
-                url = result.get('url', '')
-                domain = urlparse(url).netloc.lower()
-                
-                # Prioritize based on campaign needs
-                if campaign_context.get('social_focus'):
-                    if any(social in domain for social in 
-                          ['facebook.', 'linkedin.', 'instagram.', 'twitter.', 'x.com']):
-                        relevant_sources.append(result)
-                
-                if campaign_context.get('review_focus'):
-                    if any(review in domain for review in 
-                          ['yelp.', 'google.com/maps', 'trustpilot.', 'bbb.org']):
-                        relevant_sources.append(result)
-                
-                if campaign_context.get('news_focus'):
-                    if any(news in url.lower() for news in 
-                          ['news', 'press', 'article', 'blog', 'announcement']):
-                        relevant_sources.append(result)
+            # Drop repeats (same result matched by two focuses, tracking-query
+            # and mobile variants) keeping the first, highest-priority copy
+            unique_sources = {}
+            for source, domain in relevant_sources:
+                unique_sources.setdefault(_canonical_url_key(source['url'], domain), (source, domain))
+            if len(unique_sources) < len(relevant_sources):
+                logger.info(f"Deduplicated campaign sources: {len(relevant_sources)} -> {len(unique_sources)}")
+            
+            # Scrape relevant sources concurrently (limit to 3 for performance)
+            sources = list(unique_sources.values())[:3]
+            for source, _ in sources:
+                logger.info(f"Enriching from: {source['url']}")
             
-            # Scrape relevant sources (limit to 3 for performance)
-            for source in relevant_sources[:3]:
+            async def scrape_ranked(rank: int, source: Dict, domain: str) -> tuple:
                 try:
-                    url = source['url']
-                    logger.info(f"Enriching from: {url}")
+                    content = await self._scrape_website(source['url'], domain)
+                except Exception as e:
+                    content = e
+                return rank, source, domain, content
+            
+            # Fold each source in as soon as its scrape finishes instead of
+            # waiting on the slowest; when two sources share a type, the later
+            # one in selection order still wins, as with a sequential loop
+            type_ranks = {}
+            for next_done in asyncio.as_completed([
+                scrape_ranked(rank, source, domain)
+                for rank, (source, domain) in enumerate(sources)
+            ]):
+                rank, source, domain, content = await next_done
+                try:
+                    if isinstance(content, BaseException):
+                        raise content
                     
-                    content = await self._scrape_website(url)
+                    url = source['url']
                     if content and not content.get('error'):
-                        source_type = self._identify_source_type(url)
+                        source_type = self._identify_source_type(url, domain)
+                        if type_ranks.get(source_type, -1) > rank:
+                            continue
+                        type_ranks[source_type] = rank
                         gathered_data[f'{source_type}_data'] = content
                         
                         # Extract specific information based on source type
@@ -415,9 +526,14 @@ class PlaywrightWebGatherer:
         except Exception as e:
             logger.error(f"Error in campaign enrichment: {e}")
     
-    def _identify_source_type(self, url: str) -> str:
-        """Identify the type of source from URL."""
-        domain = urlparse(url).netloc.lower()
+    def _identify_source_type(self, url: str, domain: Optional[str] = None) -> str:
+        """Identify the type of source from URL (or its already-parsed domain)."""
+        if domain is None:
+            domain = _netloc(url)
+        
+        source_type = _SOURCE_TYPE_BY_ROOT.get(_root_domain(domain))
+        if source_type:
+            return source_type
         
         if 'facebook.' in domain:
             return 'facebook'
@@ -446,11 +562,12 @@ class PlaywrightWebGatherer:
         Returns:
             Consolidated contact information
         """
+        # Dicts used as insertion-ordered sets: first-seen values are kept first
         contacts = {
-            'phones': set(),
-            'emails': set(),
+            'phones': {},
+            'emails': {},
             'social_profiles': {},
-            'addresses': set()
+            'addresses': {}
         }
         
         # Extract from website data
@@ -458,10 +575,10 @@ class PlaywrightWebGatherer:
             website_contacts = data['website_data'].get('contact', {})
             
             if website_contacts.get('phones'):
-                contacts['phones'].update(website_contacts['phones'])
+                contacts['phones'].update(dict.fromkeys(website_contacts['phones']))
             
             if website_contacts.get('emails'):
-                contacts['emails'].update(website_contacts['emails'])
+                contacts['emails'].update(dict.fromkeys(website_contacts['emails']))
             
             if website_contacts.get('social'):
                 for platform, links in website_contacts['social'].items():
@@ -473,20 +590,20 @@ class PlaywrightWebGatherer:
             # Check GMB data
             if result.get('is_gmb'):
                 if result.get('phone'):
-                    contacts['phones'].add(result['phone'])
+                    contacts['phones'][result['phone']] = None
                 if result.get('address'):
-                    contacts['addresses'].add(result['address'])
+                    contacts['addresses'][result['address']] = None
         
         # Extract from additional enriched sources
         for key in ['facebook_data', 'linkedin_data', 'yelp_reviews_data']:
             if key in data and data[key].get('contact'):
                 source_contacts = data[key]['contact']
                 if source_contacts.get('phones'):
-                    contacts['phones'].update(source_contacts['phones'])
+                    contacts['phones'].update(dict.fromkeys(source_contacts['phones']))
                 if source_contacts.get('emails'):
-                    contacts['emails'].update(source_contacts['emails'])
+                    contacts['emails'].update(dict.fromkeys(source_contacts['emails']))
         
-        # Convert sets to lists
+        # Convert to lists
         return {
             'phones': list(contacts['phones'])[:3],
             'emails': list(contacts['emails'])[:3],
@@ -504,8 +621,10 @@ class PlaywrightWebGatherer:
         
         # Industry-based hooks
         if context.get('industry_keywords'):
+            # Serialize and lowercase the gathered data once, not per keyword
+            data_text = str(data).lower()
             for keyword in context['industry_keywords']:
-                if keyword.lower() in str(data).lower():
+                if keyword.lower() in data_text:
                     hooks.append(f"Specializes in {keyword}")
         
         # Review-based hooks
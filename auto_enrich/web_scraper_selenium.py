@@ -189,9 +189,9 @@ class SeleniumWebGatherer:
             email_matches = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', page_text)
             
             if phone_matches:
-                content['phones_found'] = list(set(phone_matches[:3]))
+                content['phones_found'] = list(dict.fromkeys(phone_matches[:3]))
             if email_matches:
-                content['emails_found'] = list(set(email_matches[:3]))
+                content['emails_found'] = list(dict.fromkeys(email_matches[:3]))
                 
             return content
             
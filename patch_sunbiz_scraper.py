@@ -10,19 +10,19 @@ import re
 from typing import Dict, Any, Optional, List
 from urllib.parse import urljoin
 
+from auto_enrich.sunbiz_scraper import SunbizScraper
+
 logger = logging.getLogger(__name__)
 
 
-class SunbizScraperFixed:
+class SunbizScraperFixed(SunbizScraper):
     """
     Fixed version of Sunbiz scraper that properly distinguishes addresses from names.
+    
+    Shares SunbizScraper's browser handling: one Chromium serves every search
+    until aclose() (or the end of an `async with` block).
     """
     
-    def __init__(self):
-        """Initialize the Sunbiz scraper."""
-        self.base_url = "https://search.sunbiz.org"
-        self.search_url = f"{self.base_url}/Inquiry/CorporationSearch/ByName"
-        
     async def search_business(self, business_name: str) -> Optional[Dict[str, Any]]:
         """
         Search for a business on Sunbiz.org and extract corporate information.
@@ -33,107 +33,101 @@ class SunbizScraperFixed:
         Returns:
             Dictionary with corporate information including officers
         """
+        context = None
         try:
-            from playwright.async_api import async_playwright
-            
-            async with async_playwright() as p:
-                # Launch browser with more realistic settings
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox'
-                    ]
-                )
-                
-                # Create context with full user agent and viewport
-                context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    viewport={'width': 1920, 'height': 1080},
-                    locale='en-US',
-                    timezone_id='America/New_York'
-                )
-                
-                # Add anti-detection scripts
-                await context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                """)
-                
-                page = await context.new_page()
-                
-                # Navigate to search page with more natural timing
-                logger.info(f"Navigating to Sunbiz search for: {business_name}")
-                await page.goto(self.search_url, wait_until='domcontentloaded')
-                
-                # Small delay to appear more human
-                await page.wait_for_timeout(1000)
-                
-                # Click on the search field first (more human-like)
-                search_input = await page.wait_for_selector('input[name="SearchTerm"]', timeout=5000)
-                await search_input.click()
-                
-                # Small delay before typing
-                await page.wait_for_timeout(500)
-                
-                # Type the business name with realistic typing speed
-                await search_input.type(business_name, delay=50)
-                
-                # Small delay before submitting
-                await page.wait_for_timeout(500)
-                
-                # Submit by clicking the Search Now button instead of pressing Enter
-                search_button = await page.query_selector('input[type="submit"][value="Search Now"]')
-                if search_button:
-                    await search_button.click()
-                else:
-                    # Fallback to Enter key
-                    await page.press('input[name="SearchTerm"]', 'Enter')
-                
-                # Wait for navigation
-                await page.wait_for_load_state('networkidle', timeout=10000)
-                
-                # Look for result links directly
-                result_links = await page.query_selector_all('a[href*="SearchResultDetail"]')
-                
-                if not result_links:
-                    logger.warning(f"No results found for: {business_name}")
-                    await browser.close()
-                    return None
-                
-                logger.info(f"Found {len(result_links)} potential matches")
-                
-                # OPTIMIZATION: Take the first result (most relevant by Sunbiz ranking)
-                # Sunbiz returns results ordered by relevance, so first match is typically best
-                best_match_link = result_links[0]
-                best_match_text = await best_match_link.inner_text()
-                logger.info(f"Taking first match from {len(result_links)} results: {best_match_text}")
-                
-                # Optional: Quick validation that first result contains key words from business name
-                business_words = set(business_name.upper().split())
-                result_words = set(best_match_text.upper().split())
-                common_words = business_words & result_words
-                
-                if len(common_words) == 0:
-                    logger.warning(f"First result '{best_match_text}' has no common words with '{business_name}' - may be incorrect match")
-                else:
-                    logger.info(f"First result has {len(common_words)} common words - looks good")
-                
-                # Click on the matching result
-                await best_match_link.click()
-                await page.wait_for_load_state('networkidle')
-                
-                # Extract information from the detail page
-                result = await self._extract_corporate_info(page)
-                
-                await browser.close()
-                return result
-                
+            # One browser serves every search; each search gets a fresh context
+            browser = await self._ensure_browser()
+            
+            # Create context with full user agent and viewport
+            context = await self._new_context(browser)
+            
+            # Add anti-detection scripts
+            await context.add_init_script("""
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+            """)
+            
+            page = await context.new_page()
+            
+            # Navigate to search page with more natural timing
+            logger.info(f"Navigating to Sunbiz search for: {business_name}")
+            await page.goto(self.search_url, wait_until='domcontentloaded')
+            
+            # Small delay to appear more human
+            await page.wait_for_timeout(1000)
+            
+            # Click on the search field first (more human-like)
+            search_input = await page.wait_for_selector('input[name="SearchTerm"]', timeout=5000)
+            await search_input.click()
+            
+            # Small delay before typing
+            await page.wait_for_timeout(500)
+            
+            # Type the business name with realistic typing speed
+            await search_input.type(business_name, delay=50)
+            
+            # Small delay before submitting
+            await page.wait_for_timeout(500)
+            
+            # Submit by clicking the Search Now button instead of pressing Enter
+            search_button = await page.query_selector('input[type="submit"][value="Search Now"]')
+            if search_button:
+                await search_button.click()
+            else:
+                # Fallback to Enter key
+                await page.press('input[name="SearchTerm"]', 'Enter')
+            
+            # Wait for navigation
+            await page.wait_for_load_state('networkidle', timeout=10000)
+            
+            # Look for result links directly
+            result_links = await page.query_selector_all('a[href*="SearchResultDetail"]')
+            
+            if not result_links:
+                logger.warning(f"No results found for: {business_name}")
+                return None
+            
+            logger.info(f"Found {len(result_links)} potential matches")
+            
+            # OPTIMIZATION: Take the first result (most relevant by Sunbiz ranking)
+            # Sunbiz returns results ordered by relevance, so first match is typically best
+            best_match_link = result_links[0]
+            best_match_text = await best_match_link.inner_text()
+            logger.info(f"Taking first match from {len(result_links)} results: {best_match_text}")
+            
+            # Optional: Quick validation that first result contains key words from business name
+            business_words = set(business_name.upper().split())
+            result_words = set(best_match_text.upper().split())
+            common_words = business_words & result_words
+            
+            if len(common_words) == 0:
+                logger.warning(f"First result '{best_match_text}' has no common words with '{business_name}' - may be incorrect match")
+            else:
+                logger.info(f"First result has {len(common_words)} common words - looks good")
+            
+            # Click on the matching result
+            await best_match_link.click()
+            await page.wait_for_load_state('networkidle')
+            
+            # Extract information from the detail page
+            result = await self._extract_corporate_info(page)
+            
+            # Keep the session cookies for the next search (saved by aclose)
+            self._storage_state = await context.storage_state()
+            self._storage_state_dirty = True
+            
+            return result
+            
         except Exception as e:
             logger.error(f"Error scraping Sunbiz for {business_name}: {e}")
             return None
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
     
     def _is_likely_address_line(self, line: str) -> bool:
         """
@@ -371,9 +365,8 @@ class SunbizScraperFixed:
 # Test function
 async def test_fixed_scraper():
     """Test the fixed Sunbiz scraper with TSAS INC."""
-    scraper = SunbizScraperFixed()
-    
-    result = await scraper.search_business("TSAS INC")
+    async with SunbizScraperFixed() as scraper:
+        result = await scraper.search_business("TSAS INC")
     
     if result:
         print("\n=== TSAS INC - Fixed Scraper Results ===")
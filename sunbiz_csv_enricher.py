@@ -170,58 +170,62 @@ async def process_csv_with_sunbiz(input_file: str, output_file: str = None, forc
     success_count = 0
     failure_count = 0
     
-    for i, row in enumerate(rows, 1):
-        dealer_name = row.get('DEALER NAME', '').strip()
-        
-        if not dealer_name:
-            logger.warning(f"Row {i}: No dealer name found, skipping")
-            failure_count += 1
-            continue
-        
-        logger.info(f"[{i}/{len(rows)}] Looking up: {dealer_name}")
+    try:
+        for i, row in enumerate(rows, 1):
+            dealer_name = row.get('DEALER NAME', '').strip()
+            
+            if not dealer_name:
+                logger.warning(f"Row {i}: No dealer name found, skipping")
+                failure_count += 1
+                continue
+            
+            logger.info(f"[{i}/{len(rows)}] Looking up: {dealer_name}")
 
-        # If owner info already exists, skip Sunbiz lookup unless --force is used
-        existing_owner_first = (row.get('Owner First Name') or row.get('OwnerFirstName') or '').strip()
-        existing_owner_last = (row.get('Owner Last Name') or row.get('OwnerLastName') or '').strip()
-        if not force and (existing_owner_first or existing_owner_last):
-            logger.info(f"[{i}/{len(rows)}] Owner already present for {dealer_name}: {existing_owner_first} {existing_owner_last} — skipping Sunbiz lookup")
-            # Ensure the canonical columns are filled so output preserves values
-            row['Owner First Name'] = existing_owner_first
-            row['Owner Last Name'] = existing_owner_last
-            continue
-        
-        try:
-            # Search on Sunbiz
-            sunbiz_data = await scraper.search_business(dealer_name)
+            # If owner info already exists, skip Sunbiz lookup unless --force is used
+            existing_owner_first = (row.get('Owner First Name') or row.get('OwnerFirstName') or '').strip()
+            existing_owner_last = (row.get('Owner Last Name') or row.get('OwnerLastName') or '').strip()
+            if not force and (existing_owner_first or existing_owner_last):
+                logger.info(f"[{i}/{len(rows)}] Owner already present for {dealer_name}: {existing_owner_first} {existing_owner_last} — skipping Sunbiz lookup")
+                # Ensure the canonical columns are filled so output preserves values
+                row['Owner First Name'] = existing_owner_first
+                row['Owner Last Name'] = existing_owner_last
+                continue
             
-            if sunbiz_data:
-                # Extract owner information
-                owner_info = extract_owner_from_sunbiz_data(sunbiz_data)
-                
-                # Update the row
-                row['Owner First Name'] = owner_info['owner_first_name']
-                row['Owner Last Name'] = owner_info['owner_last_name']
+            try:
+                # Search on Sunbiz
+                sunbiz_data = await scraper.search_business(dealer_name)
                 
-                if owner_info['owner_first_name'] or owner_info['owner_last_name']:
-                    success_count += 1
-                    logger.info(f"✓ Found owner: {owner_info['owner_first_name']} {owner_info['owner_last_name']}")
+                if sunbiz_data:
+                    # Extract owner information
+                    owner_info = extract_owner_from_sunbiz_data(sunbiz_data)
+                    
+                    # Update the row
+                    row['Owner First Name'] = owner_info['owner_first_name']
+                    row['Owner Last Name'] = owner_info['owner_last_name']
+                    
+                    if owner_info['owner_first_name'] or owner_info['owner_last_name']:
+                        success_count += 1
+                        logger.info(f"✓ Found owner: {owner_info['owner_first_name']} {owner_info['owner_last_name']}")
+                    else:
+                        failure_count += 1
+                        logger.warning(f"✗ No owner found in Sunbiz data")
                 else:
                     failure_count += 1
-                    logger.warning(f"✗ No owner found in Sunbiz data")
-            else:
+                    logger.warning(f"✗ No Sunbiz results for: {dealer_name}")
+                    row['Owner First Name'] = ''
+                    row['Owner Last Name'] = ''
+                    
+            except Exception as e:
                 failure_count += 1
-                logger.warning(f"✗ No Sunbiz results for: {dealer_name}")
+                logger.error(f"✗ Error processing {dealer_name}: {e}")
                 row['Owner First Name'] = ''
                 row['Owner Last Name'] = ''
-                
-        except Exception as e:
-            failure_count += 1
-            logger.error(f"✗ Error processing {dealer_name}: {e}")
-            row['Owner First Name'] = ''
-            row['Owner Last Name'] = ''
-        
-        # Add a small delay to be respectful to the server
-        await asyncio.sleep(0.5)
+            
+            # Add a small delay to be respectful to the server
+            await asyncio.sleep(0.5)
+    finally:
+        # Closes the shared browser and saves Sunbiz cookies once per batch
+        await scraper.aclose()
     
     # Write the enriched CSV
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
@@ -248,13 +252,12 @@ async def process_csv_with_sunbiz(input_file: str, output_file: str = None, forc
 
 async def test_single_lookup():
     """Test function to verify Sunbiz lookup works."""
-    scraper = SunbizScraper()
-    
     # Test with first company from CSV
     test_name = "BROADWAY AUTO BROKERS INC"
     logger.info(f"Testing lookup for: {test_name}")
     
-    result = await scraper.search_business(test_name)
+    async with SunbizScraper() as scraper:
+        result = await scraper.search_business(test_name)
     
     if result:
         logger.info("✓ Sunbiz lookup successful!")